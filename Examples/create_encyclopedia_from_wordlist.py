@@ -64,6 +64,7 @@ def create_encyclopedia_from_wordlist(
         create_dictionary_from_terms,
         enhance_dictionary_with_wikipedia,
         convert_dictionary_to_encyclopedia,
+        prefetch_wikipedia_data,
         add_wikipedia_descriptions_to_encyclopedia,
         add_image_links_to_encyclopedia
     )
@@ -114,13 +115,21 @@ def create_encyclopedia_from_wordlist(
     encyclopedia.merge()
     print("  ✓ Synonyms merged")
     
+    # Bulk-fetch descriptions, page images and Wikidata IDs once for steps 6 and 7,
+    # only for entries still missing a requested feature
+    prefetched = None
+    if add_wikipedia or add_images:
+        prefetched = prefetch_wikipedia_data(
+            encyclopedia.entries, verbose=verbose, descriptions=add_wikipedia, images=add_images
+        )
+    
     # Step 6: Add Wikipedia descriptions if requested (after encyclopedia creation)
     # This ensures descriptions are properly added even if dictionary conversion lost them
     wikipedia_results = None
     if add_wikipedia:
         print("\nStep 6: Adding Wikipedia descriptions to encyclopedia entries...")
         encyclopedia, wikipedia_results = add_wikipedia_descriptions_to_encyclopedia(
-            encyclopedia, batch_size=batch_size, verbose=verbose
+            encyclopedia, batch_size=batch_size, verbose=verbose, prefetched=prefetched
         )
         print(f"  ✓ Added Wikipedia descriptions: {wikipedia_results['successful']}/{wikipedia_results['total']} successful")
         print(f"    - {wikipedia_results['with_definitions']} with definitions (first sentences)")
@@ -133,7 +142,7 @@ def create_encyclopedia_from_wordlist(
     if add_images:
         print("\nStep 7: Adding image links from Wikipedia...")
         encyclopedia, image_results = add_image_links_to_encyclopedia(
-            encyclopedia, batch_size=batch_size, verbose=verbose
+            encyclopedia, batch_size=batch_size, verbose=verbose, prefetched=prefetched
         )
         print(f"  ✓ Added image links: {image_results['successful']}/{image_results['total']} successful")
         print(f"    - {image_results['with_images']} entries with images")
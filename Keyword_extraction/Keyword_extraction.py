@@ -1,6 +1,7 @@
 import os
 import re
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
 from tqdm import tqdm
 from argparse import ArgumentParser
@@ -38,6 +39,18 @@ class KeyphraseExtractionPipeline(TokenClassificationPipeline):
         return [result.get("word").strip() for result in results if result.get("word")]
 
 
+_PIPELINES = {}
+
+
+def get_extraction_pipeline(model_name):
+    """
+    Return a shared pipeline for model_name, loading the model only once per process.
+    """
+    if model_name not in _PIPELINES:
+        _PIPELINES[model_name] = KeyphraseExtractionPipeline(model_name=model_name)
+    return _PIPELINES[model_name]
+
+
 # -----------------------------
 # Keyword Extraction Class
 # -----------------------------
@@ -88,7 +101,7 @@ class KeywordExtraction:
         self.read_from_text_file(method="sentence")
 
         model_name = "ml6team/keyphrase-extraction-kbir-inspec"
-        extractor = KeyphraseExtractionPipeline(model_name=model_name)
+        extractor = get_extraction_pipeline(model_name)
 
         for i in tqdm(range(0, len(self.text), batch_size), desc="Extracting keywords"):
             batch_lines = self.text[i:i + batch_size]
@@ -116,6 +129,25 @@ class KeywordExtraction:
         return top_keywords
 
 
+# -----------------------------
+# Per-file worker
+# -----------------------------
+def _extract_one(args):
+    """
+    Extract keywords from one TXT file; top-level so worker processes can pickle it.
+    """
+    input_path, saving_path, output_filename, top_n = args
+    print(f"\nProcessing {os.path.basename(input_path)} ...")
+
+    extractor = KeywordExtraction(
+        textfile=input_path,
+        saving_path=saving_path,
+        output_filename=output_filename,
+        top_n=top_n
+    )
+    return extractor.extract_keywords()
+
+
 # -----------------------------
 # CLI
 # -----------------------------
@@ -125,6 +157,8 @@ if __name__ == "__main__":
     parser.add_argument("-o", "--output_folder", required=True, help="Folder to save outputs")
     parser.add_argument("-n", "--top_n", type=int, default=3500,
                         help="Number of top keywords to extract")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="Number of TXT files processed in parallel (each worker loads its own model)")
 
     args = parser.parse_args()
 
@@ -132,17 +166,20 @@ if __name__ == "__main__":
     os.makedirs(args.output_folder, exist_ok=True)
     txt_files = [f for f in os.listdir(args.input_folder) if f.endswith(".txt")]
 
-    for txt_file in txt_files:
-        input_path = os.path.join(args.input_folder, txt_file)
-        base_name = os.path.splitext(txt_file)[0]
-        output_filename = base_name + "_keywords.csv"
-
-        print(f"\nProcessing {txt_file} ...")
-
-        extractor = KeywordExtraction(
-            textfile=input_path,
-            saving_path=args.output_folder,
-            output_filename=output_filename,
-            top_n=args.top_n
+    jobs = [
+        (
+            os.path.join(args.input_folder, txt_file),
+            args.output_folder,
+            os.path.splitext(txt_file)[0] + "_keywords.csv",
+            args.top_n,
         )
-        extractor.extract_keywords()
+        for txt_file in txt_files
+    ]
+
+    if args.workers > 1 and len(jobs) > 1:
+        # Files are independent, so fan them out across processes to use every core
+        with ProcessPoolExecutor(max_workers=min(args.workers, len(jobs))) as executor:
+            list(executor.map(_extract_one, jobs))
+    else:
+        for job in jobs:
+            _extract_one(job)
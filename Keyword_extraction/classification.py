@@ -19,7 +19,8 @@ def classify_keywords_tfidf(input_dir, output_dir, threshold=0.6):
     for file in os.listdir(input_dir):
         if file.endswith("_keywords.csv"):
             chapter_name = file.replace("_keywords.csv", "")
-            df = pd.read_csv(os.path.join(input_dir, file))
+            # Only the keyword column is needed; skip parsing the counts
+            df = pd.read_csv(os.path.join(input_dir, file), usecols=["keyword"])
             keywords = df["keyword"].dropna().tolist()
             chapter_docs[chapter_name] = " ".join(keywords)
 
@@ -2,6 +2,13 @@ import os
 import argparse
 from bs4 import BeautifulSoup
 
+# Prefer the faster lxml parser when it is installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 def html_to_txt_folder(input_folder, output_folder):
     # Create output folder if it doesn't exist
     os.makedirs(output_folder, exist_ok=True)
@@ -15,7 +22,7 @@ def html_to_txt_folder(input_folder, output_folder):
 
             # Read and parse HTML
             with open(input_path, "r", encoding="utf-8") as f:
-                soup = BeautifulSoup(f, "html.parser")
+                soup = BeautifulSoup(f, HTML_PARSER)
                 text = soup.get_text()
 
             # Write plain text to new file
@@ -59,6 +59,8 @@ if 'search_engine' not in st.session_state:
     st.session_state.search_engine = None
 if 'encyclopedia_loaded' not in st.session_state:
     st.session_state.encyclopedia_loaded = False
+if 'all_entries' not in st.session_state:
+    st.session_state.all_entries = None
 
 
 def display_entry(entry: EncyclopediaEntry, show_html: bool = True):
@@ -155,6 +157,7 @@ def main():
                         search_engine.load_encyclopedia(html_file)
                         st.session_state.search_engine = search_engine
                         st.session_state.encyclopedia_loaded = True
+                        st.session_state.all_entries = None
                     st.success("Encyclopedia loaded successfully!")
                 except Exception as e:
                     st.error(f"Error loading encyclopedia: {e}")
@@ -238,9 +241,12 @@ def main():
     with tab2:
         st.subheader("Browse All Entries")
         
-        # Get all entries
-        with st.spinner("Loading entries..."):
-            all_entries = search_engine.get_all_entries(limit=1000)
+        # Get all entries once per loaded encyclopedia; every widget
+        # interaction reruns this script, so don't re-read the index each time
+        if st.session_state.all_entries is None:
+            with st.spinner("Loading entries..."):
+                st.session_state.all_entries = search_engine.get_all_entries(limit=1000)
+        all_entries = st.session_state.all_entries
         
         if all_entries:
             st.write(f"Showing {len(all_entries)} entries")
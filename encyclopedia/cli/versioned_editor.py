@@ -24,9 +24,13 @@ import sys
 from pathlib import Path
 from typing import Optional, List, Callable, Dict
 
+from amilib.util import Util
+
 from encyclopedia.core.encyclopedia import AmiEncyclopedia
 from Examples.create_encyclopedia_from_wordlist import create_encyclopedia_from_wordlist
 
+logger = Util.get_logger(__name__)
+
 
 def create_encyclopedia(wordlist_file: Path, output_file: Path, title: str = "Encyclopedia"):
     """Create new encyclopedia from wordlist.
@@ -298,7 +302,7 @@ def _get_first_paragraph_html_from_wikipedia_page(wikipedia_page) -> tuple:
                 
                 return _extract_definition_from_paragraph(para_elem)
     except Exception as e:
-        print(f"    Warning: Could not extract paragraph using amilib methods: {e}")
+        logger.warning("Could not extract paragraph using amilib methods: %s", e)
     
     return None, None
 
@@ -319,15 +323,15 @@ def add_wikipedia_feature(entry_dict: Dict, encyclopedia: AmiEncyclopedia):
     
     # Check if already has Wikipedia description
     if _has_non_empty_description(entry_dict) and entry_dict.get('wikipedia_url'):
-        print(f"  Entry '{term}' already has Wikipedia description")
+        logger.info("Entry '%s' already has Wikipedia description", term)
         return
     
     # Get Wikipedia page
-    print(f"  Looking up Wikipedia for '{term}'...")
+    logger.info("Looking up Wikipedia for '%s'...", term)
     wikipedia_page = _get_wikipedia_page_for_entry(entry_dict)
     
     if not wikipedia_page:
-        print(f"  ⚠ No Wikipedia page found for '{term}'")
+        logger.warning("No Wikipedia page found for '%s'", term)
         return
     
     # Extract definition and description separately using amilib methods
@@ -352,10 +356,9 @@ def add_wikipedia_feature(entry_dict: Dict, encyclopedia: AmiEncyclopedia):
             if wikidata_id:
                 entry_dict['wikidata_id'] = wikidata_id
         
-        print(f"  ✓ Added Wikipedia description for '{term}'")
-        print(f"    URL: {wikipedia_page.url}")
+        logger.info("Added Wikipedia description for '%s' from %s", term, wikipedia_page.url)
     else:
-        print(f"  ⚠ No valid content found for '{term}' (may be redirect/disambiguation)")
+        logger.warning("No valid content found for '%s' (may be redirect/disambiguation)", term)
         # Still save URL even if no description
         entry_dict['wikipedia_url'] = wikipedia_page.url
 
@@ -381,7 +384,7 @@ def _extract_images_from_wikipedia_page(wikipedia_page) -> List:
                     images.append(img_elem)
                     return images  # Success, return early
             except Exception as e:
-                print(f"    Warning: extract_a_elem_with_image_from_infobox failed: {e}")
+                logger.warning("extract_a_elem_with_image_from_infobox failed: %s", e)
         
         # Fallback: Try get_infobox and extract images from it
         if hasattr(wikipedia_page, 'get_infobox'):
@@ -394,7 +397,7 @@ def _extract_images_from_wikipedia_page(wikipedia_page) -> List:
                         images.extend(img_links[:3])  # Limit to 3 from infobox
                         return images  # Success, return early
             except Exception as e:
-                print(f"    Warning: get_infobox failed: {e}")
+                logger.warning("get_infobox failed: %s", e)
         
         # Fallback: try to find images directly in html_elem
         if hasattr(wikipedia_page, 'html_elem') and wikipedia_page.html_elem is not None:
@@ -433,10 +436,10 @@ def _extract_images_from_wikipedia_page(wikipedia_page) -> List:
                             a_elem.append(img)
                             images.append(a_elem)
             except Exception as e:
-                print(f"    Warning: Error extracting from html_elem: {e}")
+                logger.warning("Error extracting from html_elem: %s", e)
     
     except Exception as e:
-        print(f"    Warning: Error extracting images: {e}")
+        logger.warning("Error extracting images: %s", e)
     
     return images
 
@@ -496,6 +499,33 @@ def _fix_image_urls(element):
                 a.set('href', f"{wikipedia_base}{href}")
 
 
+def _create_image_link_element(href: str):
+    """Create the link to a Wikipedia image page stored as figure_html.
+    
+    Args:
+        href: Full URL of the Wikipedia File: page
+        
+    Returns:
+        <a class="wikipedia-image-link"> element labelled with the file name
+    """
+    import lxml.etree as ET
+    
+    image_link = ET.Element("a")
+    image_link.attrib["href"] = href
+    image_link.attrib["class"] = "wikipedia-image-link"
+    
+    # Get image filename from href for display
+    if '/wiki/File:' in href:
+        filename = href.split('/wiki/File:')[-1].replace('_', ' ')
+    elif '/File:' in href:
+        filename = href.split('/File:')[-1].replace('_', ' ')
+    else:
+        filename = "View image on Wikipedia"
+    
+    image_link.text = f"📷 {filename}"
+    return image_link
+
+
 def add_images_feature(entry_dict: Dict, encyclopedia: AmiEncyclopedia):
     """Add image links to entry from Wikipedia (links to Wikipedia image pages, not embedded).
     
@@ -510,17 +540,17 @@ def add_images_feature(entry_dict: Dict, encyclopedia: AmiEncyclopedia):
     
     # Check if already has images or figure_html
     if entry_dict.get('images') or entry_dict.get('figure_html'):
-        print(f"  Entry '{term}' already has images")
+        logger.info("Entry '%s' already has images", term)
         return
     
     # Get Wikipedia page
     wikipedia_page = _get_wikipedia_page_for_entry(entry_dict)
     if not wikipedia_page:
-        print(f"  Entry '{term}' has no Wikipedia page, skipping images")
+        logger.info("Entry '%s' has no Wikipedia page, skipping images", term)
         return
     
     # Extract image links using amilib methods
-    print(f"  Extracting image links for '{term}'...")
+    logger.info("Extracting image links for '%s'...", term)
     images = _extract_images_from_wikipedia_page(wikipedia_page)
     
     if images:
@@ -546,34 +576,19 @@ def add_images_feature(entry_dict: Dict, encyclopedia: AmiEncyclopedia):
                         href = f"https://en.wikipedia.org/wiki/{href}"
                 
                 # Create a simple link to the Wikipedia image page
-                image_link = ET.Element("a")
-                image_link.attrib["href"] = href
-                image_link.attrib["class"] = "wikipedia-image-link"
-                
-                # Get image filename from href for display
-                if '/wiki/File:' in href:
-                    filename = href.split('/wiki/File:')[-1].replace('_', ' ')
-                elif '/File:' in href:
-                    filename = href.split('/File:')[-1].replace('_', ' ')
-                else:
-                    filename = "View image on Wikipedia"
-                
-                image_link.text = f"📷 {filename}"
+                image_link = _create_image_link_element(href)
                 
                 # Store as figure_html (link element)
                 entry_dict['figure_html'] = image_link
                 entry_dict['image_link'] = href  # Store URL separately too
                 
-                print(f"  ✓ Added image link for '{term}'")
-                print(f"    Link: {href}")
+                logger.info("Added image link for '%s': %s", term, href)
             else:
-                print(f"  ⚠ Image element is not a link (tag: {first_img.tag if hasattr(first_img, 'tag') else 'unknown'})")
+                logger.warning("Image element is not a link (tag: %s)", first_img.tag if hasattr(first_img, 'tag') else 'unknown')
         except Exception as e:
-            print(f"  ⚠ Could not create image link for '{term}': {e}")
-            import traceback
-            traceback.print_exc()
+            logger.warning("Could not create image link for '%s': %s", term, e, exc_info=True)
     else:
-        print(f"  ⚠ No images found for '{term}'")
+        logger.warning("No images found for '%s'", term)
 
 
 def _extract_entries_from_encyclopedia_html(html_root) -> List[Dict]:
@@ -149,6 +149,16 @@ class AmiEncyclopedia:
             from amilib.ami_html import HtmlUtil
             self._original_html_root = HtmlUtil.parse_html_file_to_xml(temp_path)
             
+            # Index original entry divs once by term and name (first match wins, as with
+            # XPath); an XPath scan of the whole document per entry was quadratic
+            original_by_term = {}
+            original_by_name = {}
+            for original_div in self._original_html_root.xpath(".//div[@role='ami_entry']"):
+                if original_div.get('term') is not None:
+                    original_by_term.setdefault(original_div.get('term'), original_div)
+                if original_div.get('name') is not None:
+                    original_by_name.setdefault(original_div.get('name'), original_div)
+            
             # Use AmiDictionary to parse (composition)
             self.dictionary = AmiDictionary.create_from_html_file(temp_path, ignorecase=False)
             
@@ -192,23 +202,17 @@ class AmiEncyclopedia:
                 # If still not found, try to get from original HTML element before dictionary processing
                 # AmiDictionary creates new entry elements and only copies term/id, so wikidataID is lost
                 # Use the original HTML root we stored during parsing
-                if not wikidata_id and hasattr(self, '_original_html_root'):
-                    try:
-                        # Find the original HTML entry element by term
-                        original_entries = self._original_html_root.xpath(f".//div[@role='ami_entry' and @term='{term}']")
-                        if not original_entries:
-                            # Try by name attribute as fallback
-                            original_entries = self._original_html_root.xpath(f".//div[@role='ami_entry' and @name='{term}']")
-                        if original_entries:
-                            orig_entry = original_entries[0]
-                            wikidata_id = (
-                                orig_entry.get('wikidataID') or 
-                                orig_entry.get('wikidataid') or  # Lowercase from HTML parser
-                                orig_entry.get('wikidata_id') or
-                                ''
-                            )
-                    except Exception:
-                        pass
+                # Find the original HTML entry element by term, with name attribute as fallback
+                orig_entry = original_by_term.get(term)
+                if orig_entry is None:
+                    orig_entry = original_by_name.get(term)
+                if not wikidata_id and orig_entry is not None:
+                    wikidata_id = (
+                        orig_entry.get('wikidataID') or 
+                        orig_entry.get('wikidataid') or  # Lowercase from HTML parser
+                        orig_entry.get('wikidata_id') or
+                        ''
+                    )
                 
                 # Extract wikipedia_url for display purposes (also needed for Wikidata ID lookup)
                 # Try from entry element first
@@ -220,21 +224,13 @@ class AmiEncyclopedia:
                 )
                 
                 # If not found, try from original HTML element (AmiDictionary may strip attributes)
-                if not wikipedia_url and hasattr(self, '_original_html_root'):
-                    try:
-                        original_entries = self._original_html_root.xpath(f".//div[@role='ami_entry' and @term='{term}']")
-                        if not original_entries:
-                            original_entries = self._original_html_root.xpath(f".//div[@role='ami_entry' and @name='{term}']")
-                        if original_entries:
-                            orig_entry = original_entries[0]
-                            wikipedia_url = (
-                                orig_entry.get('wikipedia_url') or 
-                                orig_entry.get('wikipediaURL') or
-                                orig_entry.get('wikipedia-url') or
-                                ''
-                            )
-                    except Exception:
-                        pass
+                if not wikipedia_url and orig_entry is not None:
+                    wikipedia_url = (
+                        orig_entry.get('wikipedia_url') or 
+                        orig_entry.get('wikipediaURL') or
+                        orig_entry.get('wikipedia-url') or
+                        ''
+                    )
                 
                 # Priority 2: If no Wikipedia URL attribute, check for Wikipedia link in the search term paragraph
                 if not wikipedia_url:
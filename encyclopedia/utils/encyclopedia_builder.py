@@ -5,13 +5,130 @@ Provides functions for creating encyclopedias from wordlists with
 Wikipedia integration, image links, and validation.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from pathlib import Path
+from urllib.parse import quote, unquote
 import lxml.etree as ET
+import lxml.html
+import requests
+
+try:
+    from tqdm import tqdm
+except ImportError:
+    tqdm = None
 
 from encyclopedia.core.encyclopedia import AmiEncyclopedia
+from encyclopedia.cli.versioned_editor import (
+    add_images_feature,
+    add_wikipedia_feature,
+    _create_image_link_element,
+    _extract_definition_from_paragraph,
+    _filter_wikipedia_messages,
+    _has_non_empty_description
+)
 from encyclopedia.utils.resources import Resources
 from amilib.ami_dict import AmiDictionary
+from amilib.util import Util
+
+logger = Util.get_logger(__name__)
+
+# Caps the number of Wikipedia lookups in flight across all worker threads
+MAX_CONCURRENT_LOOKUPS = 16
+_RATE_LIMITER = threading.Semaphore(MAX_CONCURRENT_LOOKUPS)
+
+WIKIPEDIA_BASE_URL = "https://en.wikipedia.org"
+WIKIPEDIA_API_URL = "https://en.wikipedia.org/w/api.php"
+WIKIPEDIA_API_HEADERS = {'User-Agent': 'Encyclopedia Builder/1.0'}
+# MediaWiki accepts at most 50 titles per action=query request
+PREFETCH_BATCH_SIZE = 50
+
+
+def _rate_limited_call(
+    entry_func: Callable,
+    entry: Dict,
+    encyclopedia: AmiEncyclopedia,
+    verbose: bool
+) -> Dict[str, Any]:
+    """
+    Call a per-entry function while holding the shared rate limiter.
+    
+    Args:
+        entry_func: Per-entry function (entry, encyclopedia, verbose) -> result dict
+        entry: Entry dictionary to enhance
+        encyclopedia: Encyclopedia instance
+        verbose: If True, show detailed progress
+        
+    Returns:
+        Result dictionary from entry_func
+    """
+    with _RATE_LIMITER:
+        return entry_func(entry, encyclopedia, verbose)
+
+
+def _process_batch_concurrently(
+    entry_func: Callable,
+    batch: List[Dict],
+    encyclopedia: AmiEncyclopedia,
+    verbose: bool,
+    executor: ThreadPoolExecutor
+) -> List[Tuple[Dict, Dict[str, Any]]]:
+    """
+    Run a per-entry function over a batch on a shared thread pool.
+    
+    Each call is dominated by Wikipedia HTTP fetches, so a batch takes
+    roughly as long as its slowest entry rather than the sum of all entries.
+    
+    Args:
+        entry_func: Per-entry function (entry, encyclopedia, verbose) -> result dict
+        batch: Entries to process
+        encyclopedia: Encyclopedia instance
+        verbose: If True, show detailed progress
+        executor: Thread pool of MAX_CONCURRENT_LOOKUPS workers, shared by all batches of a pass
+        
+    Returns:
+        List of (entry, result) tuples in batch order
+    """
+    if not batch:
+        return []
+    results = executor.map(
+        lambda entry: _rate_limited_call(entry_func, entry, encyclopedia, verbose),
+        batch
+    )
+    return list(zip(batch, results))
+
+
+class _NoProgress:
+    """Stand-in for a tqdm bar when tqdm is not installed"""
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def update(self, n: int = 1) -> None:
+        pass
+
+
+def _progress_bar(total: int, verbose: bool, desc: str):
+    """
+    Create a per-entry progress bar, shown only when verbose.
+    
+    Args:
+        total: Number of entries to process
+        verbose: If True, display the bar
+        desc: Label shown before the bar
+        
+    Returns:
+        tqdm bar, or a no-op stand-in if tqdm is not installed
+    """
+    if tqdm is None:
+        return _NoProgress()
+    return tqdm(total=total, desc=desc, unit="entry", disable=not verbose)
 
 
 def create_dictionary_from_terms(
@@ -55,24 +172,31 @@ def enhance_dictionary_with_wikipedia(
     """
     from amilib.wikimedia import WikipediaPage
     
+    # Probe capabilities once; all entries share the same class
+    first_entry = next(iter(dictionary.entry_by_term.values()), None)
+    entry_can_add = hasattr(first_entry, 'add_wikipedia_page')
+    dictionary_can_add = hasattr(dictionary, 'add_wikipedia_page')
+    
+    if not (entry_can_add or dictionary_can_add):
+        # Nothing could store the page, so skip the lookups entirely
+        logger.warning("Installed amilib cannot attach Wikipedia pages to dictionary entries, skipping")
+        return dictionary
+    
     enhanced_count = 0
     for term, ami_entry in dictionary.entry_by_term.items():
         try:
             wikipedia_page = WikipediaPage.lookup_wikipedia_page_for_term(term)
             if wikipedia_page:
-                # Try to add Wikipedia page if method exists
-                if hasattr(ami_entry, 'add_wikipedia_page'):
+                if entry_can_add:
                     ami_entry.add_wikipedia_page(wikipedia_page)
-                    enhanced_count += 1
-                elif hasattr(dictionary, 'add_wikipedia_page'):
+                else:
                     dictionary.add_wikipedia_page(ami_entry, wikipedia_page)
-                    enhanced_count += 1
+                enhanced_count += 1
         except Exception as e:
-            if verbose:
-                print(f"  Warning: Could not enhance '{term}' with Wikipedia: {e}")
+            logger.warning("Could not enhance '%s' with Wikipedia: %s", term, e)
     
     if verbose:
-        print(f"  ✓ Enhanced {enhanced_count}/{len(dictionary.entry_by_term)} entries with Wikipedia")
+        logger.info("Enhanced %d/%d entries with Wikipedia", enhanced_count, len(dictionary.entry_by_term))
     
     return dictionary
 
@@ -213,10 +337,295 @@ def convert_dictionary_to_encyclopedia(
     return encyclopedia
 
 
+def _prefetch_title(entry: Dict) -> str:
+    """
+    Title under which an entry is prefetched and looked up.
+    
+    Like _get_wikipedia_page_for_entry, a stored Wikipedia URL takes
+    precedence over the term.
+    
+    Args:
+        entry: Entry dictionary
+        
+    Returns:
+        Page title from wikipedia_url, else the term (may be empty)
+    """
+    wikipedia_url = (entry.get('wikipedia_url') or '').strip()
+    if '/wiki/' in wikipedia_url:
+        title = wikipedia_url.split('/wiki/', 1)[1].split('#', 1)[0].split('?', 1)[0]
+        title = unquote(title).replace('_', ' ').strip()
+        if title:
+            return title
+    return entry.get('term', entry.get('canonical_term', ''))
+
+
+def _fetch_first_paragraph_html(title: str) -> Optional[str]:
+    """
+    Fetch the lead section of a page and return its first content paragraph.
+    
+    Uses action=parse so the paragraph keeps its Wikipedia links, as the
+    paragraph taken by add_wikipedia_feature from the full page does.
+    
+    Args:
+        title: Resolved page title
+        
+    Returns:
+        HTML string of the first non-empty paragraph, or None
+    """
+    params = {
+        'action': 'parse',
+        'format': 'json',
+        'formatversion': '2',
+        'page': title,
+        'prop': 'text',
+        'section': '0',
+        'redirects': '1',
+        'disableeditsection': '1',
+        'disablelimitreport': '1',
+    }
+    with _RATE_LIMITER:
+        response = requests.get(WIKIPEDIA_API_URL, params=params, headers=WIKIPEDIA_API_HEADERS, timeout=30)
+    response.raise_for_status()
+    lead_html = response.json().get('parse', {}).get('text', '')
+    if not lead_html.strip():
+        return None
+    
+    lead = lxml.html.fromstring(lead_html)
+    # Top-level paragraphs only, so infobox and hatnote content is skipped
+    paragraphs = (lead.xpath("descendant-or-self::div[contains(@class, 'mw-parser-output')][1]/p")
+                  or lead.xpath(".//p"))
+    for para in paragraphs:
+        if 'mw-empty-elt' in para.get('class', ''):
+            continue
+        para_text = para.text_content().strip()
+        if para_text and not _filter_wikipedia_messages(para_text):
+            return lxml.html.tostring(para, encoding='unicode', with_tail=False)
+    return None
+
+
+def prefetch_wikipedia_data(
+    entries: List[Dict],
+    batch_size: int = PREFETCH_BATCH_SIZE,
+    verbose: bool = False,
+    descriptions: bool = True,
+    images: bool = True
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Bulk-fetch first paragraph, page image and Wikidata ID for entries.
+    
+    Page URLs, images and Wikidata IDs come from one MediaWiki action=query
+    request (plus continuations) per batch of titles. First paragraphs come
+    from one action=parse request per page, run concurrently. Only entries
+    that still need a description or image are fetched.
+    
+    Args:
+        entries: Entry dictionaries (wikipedia_url title, else term, used as title)
+        batch_size: Titles per request (MediaWiki maximum is 50)
+        verbose: If True, show detailed progress
+        descriptions: If True, prefetch for entries still needing a description
+        images: If True, prefetch for entries still needing an image
+        
+    Returns:
+        Dictionary mapping lookup title, and resolved page title, to page data with keys:
+        - title: str (resolved page title)
+        - url: str (full Wikipedia URL)
+        - first_para_html: str or None (first lead paragraph, links preserved)
+        - pageimage: str or None (image file name without 'File:')
+        - wikibase_item: str or None (Wikidata ID)
+    """
+    # Unique titles in entry order, and those that need a first paragraph
+    titles = {}
+    for entry in entries:
+        needs_description = descriptions and _needs_description(entry)
+        if not (needs_description or (images and _needs_image(entry))):
+            continue
+        title = _prefetch_title(entry)
+        if title:
+            titles[title] = titles.get(title, False) or needs_description
+    lookup_titles = list(titles)
+    
+    prefetched = {}
+    batch_size = min(batch_size, PREFETCH_BATCH_SIZE)
+    for batch_start in range(0, len(lookup_titles), batch_size):
+        batch = lookup_titles[batch_start:batch_start + batch_size]
+        params = {
+            'action': 'query',
+            'format': 'json',
+            'formatversion': '2',
+            'prop': 'pageimages|pageprops|info',
+            'piprop': 'name',
+            'ppprop': 'wikibase_item',
+            'inprop': 'url',
+            'redirects': '1',
+            'titles': '|'.join(batch),
+        }
+        pages = {}
+        normalized = {}
+        redirects = {}
+        continuation = {}
+        try:
+            while True:
+                response = requests.get(
+                    WIKIPEDIA_API_URL,
+                    params={**params, **continuation},
+                    headers=WIKIPEDIA_API_HEADERS,
+                    timeout=30
+                )
+                response.raise_for_status()
+                data = response.json()
+                query = data.get('query', {})
+                # Title mappings only appear in the first response
+                normalized.update({item['from']: item['to'] for item in query.get('normalized', [])})
+                redirects.update({item['from']: item['to'] for item in query.get('redirects', [])})
+                # Continuations return further props for the same pages
+                for page in query.get('pages', []):
+                    if page.get('missing') or page.get('invalid'):
+                        continue
+                    merged = pages.setdefault(page['title'], {})
+                    for key, value in page.items():
+                        if value is not None and key not in merged:
+                            merged[key] = value
+                if 'continue' not in data:
+                    break
+                continuation = data['continue']
+        except Exception as e:
+            logger.warning("Wikipedia prefetch failed for batch starting at %d: %s", batch_start + 1, e)
+            continue
+        
+        for lookup_title in batch:
+            title = normalized.get(lookup_title, lookup_title)
+            page = pages.get(redirects.get(title, title))
+            if not page:
+                continue
+            page_data = prefetched.get(page['title']) or {
+                'title': page['title'],
+                'url': page.get('fullurl') or f"{WIKIPEDIA_BASE_URL}/wiki/{page['title'].replace(' ', '_')}",
+                'first_para_html': None,
+                'pageimage': page.get('pageimage'),
+                'wikibase_item': page.get('pageprops', {}).get('wikibase_item'),
+            }
+            prefetched[lookup_title] = page_data
+            # Entries given a URL from this page look it up by its resolved title later
+            prefetched[page['title']] = page_data
+    
+    # First paragraphs need the page HTML, one parse request per distinct page
+    pages_to_parse = list({
+        id(page_data): page_data for lookup_title, page_data in prefetched.items()
+        if titles.get(lookup_title)
+    }.values())
+    if pages_to_parse:
+        def fetch(page_data):
+            try:
+                return _fetch_first_paragraph_html(page_data['title'])
+            except Exception as e:
+                logger.warning("Could not prefetch first paragraph of '%s': %s", page_data['title'], e)
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_LOOKUPS, len(pages_to_parse))) as executor:
+            for page_data, first_para_html in zip(pages_to_parse, executor.map(fetch, pages_to_parse)):
+                page_data['first_para_html'] = first_para_html
+    
+    if verbose:
+        found = sum(1 for lookup_title in lookup_titles if lookup_title in prefetched)
+        logger.info("Prefetched Wikipedia data for %d/%d entries", found, len(lookup_titles))
+    
+    return prefetched
+
+
+def _apply_prefetched_description(entry: Dict, page_data: Dict[str, Any]) -> bool:
+    """
+    Populate description fields of an entry from prefetched page data.
+    
+    Runs the prefetched first paragraph through the same definition
+    extraction as add_wikipedia_feature, so links and structure match.
+    An existing wikipedia_url or wikidata_id is never replaced.
+    
+    Args:
+        entry: Entry dictionary to enhance
+        page_data: Page data from prefetch_wikipedia_data()
+        
+    Returns:
+        True if a description was added
+    """
+    if not entry.get('wikipedia_url'):
+        entry['wikipedia_url'] = page_data['url']
+    if page_data.get('wikibase_item') and not entry.get('wikidata_id'):
+        entry['wikidata_id'] = page_data['wikibase_item']
+    
+    first_para_html = page_data.get('first_para_html')
+    if not first_para_html:
+        return False
+    
+    para_elem = lxml.html.fragment_fromstring(first_para_html)
+    definition_html, description_html = _extract_definition_from_paragraph(para_elem)
+    if not description_html:
+        return False
+    
+    entry['description_html'] = description_html
+    if definition_html:
+        entry['definition_html'] = definition_html
+    return True
+
+
+def _apply_prefetched_image(entry: Dict, page_data: Dict[str, Any]) -> bool:
+    """
+    Populate image link fields of an entry from prefetched page data.
+    
+    Builds the link with the same helper as add_images_feature, from a
+    File: URL encoded the way Wikipedia encodes its own File: links.
+    
+    Args:
+        entry: Entry dictionary to enhance
+        page_data: Page data from prefetch_wikipedia_data()
+        
+    Returns:
+        True if an image link was added
+    """
+    pageimage = page_data.get('pageimage')
+    if not pageimage:
+        return False
+    
+    # MediaWiki leaves these characters unescaped in page URLs
+    href = f"{WIKIPEDIA_BASE_URL}/wiki/File:{quote(pageimage.replace(' ', '_'), safe=';@$!*(),/~:')}"
+    entry['figure_html'] = _create_image_link_element(href)
+    entry['image_link'] = href
+    return True
+
+
+def _needs_description(entry: Dict) -> bool:
+    """
+    Check whether an entry still needs a Wikipedia description.
+    
+    Args:
+        entry: Entry dictionary
+        
+    Returns:
+        True unless the entry has both a non-empty description and a Wikipedia URL
+    """
+    return not (_has_non_empty_description(entry) and entry.get('wikipedia_url'))
+
+
+def _needs_image(entry: Dict) -> bool:
+    """
+    Check whether an entry still needs an image link.
+    
+    Args:
+        entry: Entry dictionary
+        
+    Returns:
+        True unless the entry already has images or figure_html
+    """
+    figure_html = entry.get('figure_html')
+    # figure_html may be an lxml element, whose truth value reflects child count
+    has_figure = bool(figure_html) if isinstance(figure_html, str) else figure_html is not None
+    return not (entry.get('images') or has_figure)
+
+
 def add_wikipedia_description_to_entry(
     entry: Dict,
     encyclopedia: AmiEncyclopedia,
-    verbose: bool = False
+    verbose: bool = False,
+    prefetched: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Add Wikipedia description to a single entry, extracting first sentence.
@@ -225,6 +634,8 @@ def add_wikipedia_description_to_entry(
         entry: Entry dictionary to enhance
         encyclopedia: Encyclopedia instance (for lookups)
         verbose: If True, show detailed progress
+        prefetched: Optional page data from prefetch_wikipedia_data(); terms
+            found there are filled without a per-entry page fetch
         
     Returns:
         Dictionary with:
@@ -234,11 +645,6 @@ def add_wikipedia_description_to_entry(
         - wikipedia_url: str or None
         - error: str or None
     """
-    from encyclopedia.cli.versioned_editor import (
-        add_wikipedia_feature,
-        _has_non_empty_description
-    )
-    
     term = entry.get('term', entry.get('canonical_term', ''))
     result = {
         'success': False,
@@ -257,8 +663,10 @@ def add_wikipedia_description_to_entry(
             result['has_definition'] = bool(entry.get('definition_html'))
             return result
         
-        # Add Wikipedia feature
-        add_wikipedia_feature(entry, encyclopedia)
+        # Use prefetched page data if available, else fetch the page
+        page_data = prefetched.get(_prefetch_title(entry)) if prefetched else None
+        if not (page_data and _apply_prefetched_description(entry, page_data)):
+            add_wikipedia_feature(entry, encyclopedia)
         
         # Check results
         if entry.get('wikipedia_url'):
@@ -276,8 +684,7 @@ def add_wikipedia_description_to_entry(
             
     except Exception as e:
         result['error'] = str(e)
-        if verbose:
-            print(f"    Error adding Wikipedia to '{term}': {e}")
+        logger.warning("Error adding Wikipedia to '%s': %s", term, e)
     
     return result
 
@@ -285,7 +692,8 @@ def add_wikipedia_description_to_entry(
 def add_wikipedia_descriptions_to_encyclopedia(
     encyclopedia: AmiEncyclopedia,
     batch_size: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    prefetched: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Tuple[AmiEncyclopedia, Dict[str, Any]]:
     """
     Step 5: Add Wikipedia descriptions to encyclopedia entries.
@@ -294,6 +702,7 @@ def add_wikipedia_descriptions_to_encyclopedia(
         encyclopedia: Encyclopedia to enhance
         batch_size: Number of entries to process at a time
         verbose: If True, show detailed progress
+        prefetched: Optional page data from prefetch_wikipedia_data()
         
     Returns:
         Tuple of (enhanced_encyclopedia, results_dict)
@@ -311,41 +720,59 @@ def add_wikipedia_descriptions_to_encyclopedia(
     }
     
     if verbose:
-        print(f"\nAdding Wikipedia descriptions to {total_entries} entries...")
-        print(f"Processing in batches of {batch_size}...")
+        logger.info("Adding Wikipedia descriptions to %d entries in batches of %d", total_entries, batch_size)
+    
+    entry_func = partial(add_wikipedia_description_to_entry, prefetched=prefetched)
+    
+    # Split off already-described entries once so batches only hold pending work
+    pending = []
+    already_done = []
+    for entry in entries_list:
+        if _needs_description(entry):
+            pending.append(entry)
+        else:
+            already_done.append(entry)
+    total_pending = len(pending)
+    
+    results['successful'] = len(already_done)
+    results['with_descriptions'] = len(already_done)
+    results['with_definitions'] = sum(1 for entry in already_done if entry.get('definition_html'))
+    
+    if verbose and already_done:
+        logger.info("Skipping %d entries that already have descriptions", len(already_done))
     
     # Process in batches
-    for batch_start in range(0, total_entries, batch_size):
-        batch_end = min(batch_start + batch_size, total_entries)
-        batch = entries_list[batch_start:batch_end]
-        
-        if verbose:
-            print(f"  Processing batch {batch_start // batch_size + 1}: entries {batch_start + 1}-{batch_end} of {total_entries}")
-        
-        for entry in batch:
-            result = add_wikipedia_description_to_entry(entry, encyclopedia, verbose)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LOOKUPS) as executor, \
+            _progress_bar(total_pending, verbose, "Descriptions") as progress:
+        for batch_start in range(0, total_pending, batch_size):
+            batch_end = min(batch_start + batch_size, total_pending)
+            batch = pending[batch_start:batch_end]
             
-            if result['success']:
-                results['successful'] += 1
-                if result['has_description']:
-                    results['with_descriptions'] += 1
-                if result['has_definition']:
-                    results['with_definitions'] += 1
-            else:
-                if result['error'] and 'No Wikipedia page' in result['error']:
-                    results['no_wikipedia'].append({
-                        'term': entry.get('term', entry.get('canonical_term', 'Unknown')),
-                        'error': result['error']
-                    })
+            for entry, result in _process_batch_concurrently(
+                entry_func, batch, encyclopedia, verbose, executor
+            ):
+                progress.update(1)
+                if result['success']:
+                    results['successful'] += 1
+                    if result['has_description']:
+                        results['with_descriptions'] += 1
+                    if result['has_definition']:
+                        results['with_definitions'] += 1
                 else:
-                    results['failed'].append({
-                        'term': entry.get('term', entry.get('canonical_term', 'Unknown')),
-                        'error': result['error']
-                    })
-        
-        if verbose:
-            print(f"  ✓ Processed {batch_end}/{total_entries} entries "
-                  f"({results['successful']} successful, {results['with_definitions']} with definitions)...")
+                    if result['error'] and 'No Wikipedia page' in result['error']:
+                        results['no_wikipedia'].append({
+                            'term': entry.get('term', entry.get('canonical_term', 'Unknown')),
+                            'error': result['error']
+                        })
+                    else:
+                        results['failed'].append({
+                            'term': entry.get('term', entry.get('canonical_term', 'Unknown')),
+                            'error': result['error']
+                        })
+            
+            if verbose:
+                logger.info("Processed %d/%d pending entries (%d successful, %d with definitions)",
+                            batch_end, total_pending, results['successful'], results['with_definitions'])
     
     return encyclopedia, results
 
@@ -353,7 +780,8 @@ def add_wikipedia_descriptions_to_encyclopedia(
 def add_image_link_to_entry(
     entry: Dict,
     encyclopedia: AmiEncyclopedia,
-    verbose: bool = False
+    verbose: bool = False,
+    prefetched: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Dict[str, Any]:
     """
     Add Wikipedia image link to a single entry.
@@ -362,6 +790,8 @@ def add_image_link_to_entry(
         entry: Entry dictionary to enhance
         encyclopedia: Encyclopedia instance
         verbose: If True, show detailed progress
+        prefetched: Optional page data from prefetch_wikipedia_data(); terms
+            found there are filled without a per-entry page fetch
         
     Returns:
         Dictionary with:
@@ -370,8 +800,6 @@ def add_image_link_to_entry(
         - image_url: str or None
         - error: str or None
     """
-    from encyclopedia.cli.versioned_editor import add_images_feature
-    
     term = entry.get('term', entry.get('canonical_term', ''))
     result = {
         'success': False,
@@ -382,25 +810,28 @@ def add_image_link_to_entry(
     
     try:
         # Check if already has image
-        if entry.get('images') or entry.get('figure_html'):
+        if not _needs_image(entry):
             result['success'] = True
             result['has_image_link'] = True
             result['image_url'] = entry.get('image_link')
             return result
         
-        # Add image feature
-        add_images_feature(entry, encyclopedia)
+        # Use prefetched page image if available, else fetch the page
+        page_data = prefetched.get(_prefetch_title(entry)) if prefetched else None
+        if not (page_data and _apply_prefetched_image(entry, page_data)):
+            add_images_feature(entry, encyclopedia)
         
         # Check results
         figure_html = entry.get('figure_html')
         image_link = entry.get('image_link')
         
-        if figure_html or image_link:
+        # figure_html may be a childless lxml element, which is falsy
+        if figure_html is not None or image_link:
             result['success'] = True
             result['has_image_link'] = True
             
             # Extract URL from figure_html if it's an element
-            if figure_html and hasattr(figure_html, 'get'):
+            if figure_html is not None and hasattr(figure_html, 'get'):
                 result['image_url'] = figure_html.get('href') or image_link
             else:
                 result['image_url'] = image_link
@@ -409,8 +840,7 @@ def add_image_link_to_entry(
             
     except Exception as e:
         result['error'] = str(e)
-        if verbose:
-            print(f"    Error adding image to '{term}': {e}")
+        logger.warning("Error adding image to '%s': %s", term, e)
     
     return result
 
@@ -418,7 +848,8 @@ def add_image_link_to_entry(
 def add_image_links_to_encyclopedia(
     encyclopedia: AmiEncyclopedia,
     batch_size: int = 10,
-    verbose: bool = False
+    verbose: bool = False,
+    prefetched: Optional[Dict[str, Dict[str, Any]]] = None
 ) -> Tuple[AmiEncyclopedia, Dict[str, Any]]:
     """
     Step 8: Add Wikipedia image links to encyclopedia entries.
@@ -427,6 +858,7 @@ def add_image_links_to_encyclopedia(
         encyclopedia: Encyclopedia to enhance
         batch_size: Number of entries to process at a time
         verbose: If True, show detailed progress
+        prefetched: Optional page data from prefetch_wikipedia_data()
         
     Returns:
         Tuple of (enhanced_encyclopedia, results_dict)
@@ -443,38 +875,90 @@ def add_image_links_to_encyclopedia(
     }
     
     if verbose:
-        print(f"\nAdding image links to {total_entries} entries...")
-        print(f"Processing in batches of {batch_size}...")
+        logger.info("Adding image links to %d entries in batches of %d", total_entries, batch_size)
+    
+    entry_func = partial(add_image_link_to_entry, prefetched=prefetched)
+    
+    # Split off entries that already have images so batches only hold pending work
+    pending = [entry for entry in entries_list if _needs_image(entry)]
+    total_pending = len(pending)
+    already_done = total_entries - total_pending
+    results['successful'] = already_done
+    results['with_images'] = already_done
+    
+    if verbose and already_done:
+        logger.info("Skipping %d entries that already have images", already_done)
     
     # Process in batches
-    for batch_start in range(0, total_entries, batch_size):
-        batch_end = min(batch_start + batch_size, total_entries)
-        batch = entries_list[batch_start:batch_end]
-        
-        if verbose:
-            print(f"  Processing batch {batch_start // batch_size + 1}: entries {batch_start + 1}-{batch_end} of {total_entries}")
-        
-        for entry in batch:
-            result = add_image_link_to_entry(entry, encyclopedia, verbose)
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_LOOKUPS) as executor, \
+            _progress_bar(total_pending, verbose, "Image links") as progress:
+        for batch_start in range(0, total_pending, batch_size):
+            batch_end = min(batch_start + batch_size, total_pending)
+            batch = pending[batch_start:batch_end]
             
-            if result['success']:
-                results['successful'] += 1
-                if result['has_image_link']:
-                    results['with_images'] += 1
-            else:
-                if result['error'] and 'No images found' in result['error']:
-                    results['no_images'].append({
-                        'term': entry.get('term', entry.get('canonical_term', 'Unknown')),
-                        'wikipedia_url': entry.get('wikipedia_url', '')
-                    })
+            for entry, result in _process_batch_concurrently(
+                entry_func, batch, encyclopedia, verbose, executor
+            ):
+                progress.update(1)
+                if result['success']:
+                    results['successful'] += 1
+                    if result['has_image_link']:
+                        results['with_images'] += 1
                 else:
-                    results['failed'].append({
-                        'term': entry.get('term', entry.get('canonical_term', 'Unknown')),
-                        'error': result['error']
-                    })
-        
-        if verbose:
-            print(f"  ✓ Processed {batch_end}/{total_entries} entries "
-                  f"({results['successful']} successful, {results['with_images']} with images)...")
+                    if result['error'] and 'No images found' in result['error']:
+                        results['no_images'].append({
+                            'term': entry.get('term', entry.get('canonical_term', 'Unknown')),
+                            'wikipedia_url': entry.get('wikipedia_url', '')
+                        })
+                    else:
+                        results['failed'].append({
+                            'term': entry.get('term', entry.get('canonical_term', 'Unknown')),
+                            'error': result['error']
+                        })
+            
+            if verbose:
+                logger.info("Processed %d/%d pending entries (%d successful, %d with images)",
+                            batch_end, total_pending, results['successful'], results['with_images'])
     
     return encyclopedia, results
+
+
+def enrich_encyclopedia_full(
+    encyclopedia: AmiEncyclopedia,
+    add_images: bool = True,
+    batch_size: int = 10,
+    verbose: bool = False
+) -> Tuple[AmiEncyclopedia, Dict[str, Any]]:
+    """
+    Add Wikipedia descriptions and image links from a single prefetch pass.
+    
+    Descriptions, page images and Wikidata IDs are bulk-fetched once with
+    prefetch_wikipedia_data(); only terms missing from the prefetch fall
+    back to per-entry page lookups.
+    
+    Args:
+        encyclopedia: Encyclopedia to enhance
+        add_images: If True, also add image links
+        batch_size: Number of entries to process at a time
+        verbose: If True, show detailed progress
+        
+    Returns:
+        Tuple of (enhanced_encyclopedia, results_dict) where results_dict has
+        'descriptions' and 'images' (None if add_images is False) results
+    """
+    # Only entries that still need at least one feature are prefetched
+    prefetched = prefetch_wikipedia_data(encyclopedia.entries, verbose=verbose, images=add_images)
+    
+    encyclopedia, description_results = add_wikipedia_descriptions_to_encyclopedia(
+        encyclopedia, batch_size=batch_size, verbose=verbose, prefetched=prefetched
+    )
+    image_results = None
+    if add_images:
+        encyclopedia, image_results = add_image_links_to_encyclopedia(
+            encyclopedia, batch_size=batch_size, verbose=verbose, prefetched=prefetched
+        )
+    
+    return encyclopedia, {
+        'descriptions': description_results,
+        'images': image_results
+    }
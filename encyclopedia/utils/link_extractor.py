@@ -9,7 +9,6 @@ import time
 from pathlib import Path
 from urllib.parse import urljoin, urlparse, unquote
 from typing import Dict, List, Optional, Tuple
-from collections import Counter
 
 from amilib.ami_html import HtmlLib
 from amilib.wikimedia import WikipediaPage
@@ -90,16 +89,13 @@ class EncyclopediaLinkExtractor:
         if not desc_element:
             return links
         
-        link_elements = desc_element.xpath(".//a[@href]")
+        # Skip citation links (#cite_note-, #cite_ref-) inside the XPath engine
+        link_elements = desc_element.xpath(".//a[@href and not(starts-with(@href, '#cite'))]")
         for link_elem in link_elements:
             href = link_elem.get('href', '')
             text = link_elem.text or ''
             title = link_elem.get('title', '')
             
-            # Skip citation links
-            if href.startswith('#cite'):
-                continue
-            
             link_info = {
                 'href': href,
                 'text': text,
@@ -176,7 +172,7 @@ class EncyclopediaLinkExtractor:
     
     def find_shared_article_links(self, entries: List[Dict], min_occurrences: int = 2) -> Dict:
         """Find article links that appear in multiple entries"""
-        article_link_counter = Counter()
+        # Each occurrence is one record, so the list length is the occurrence count
         link_to_entries = {}
         
         for entry in entries:
@@ -189,11 +185,7 @@ class EncyclopediaLinkExtractor:
                         f"https://en.wikipedia.org{href}" if href.startswith('/wiki/') else href
                     )
                     
-                    article_link_counter[normalized_href] += 1
-                    
-                    if normalized_href not in link_to_entries:
-                        link_to_entries[normalized_href] = []
-                    link_to_entries[normalized_href].append({
+                    link_to_entries.setdefault(normalized_href, []).append({
                         'term': entry_term,
                         'link_text': link.get('text', ''),
                         'title': link.get('title', '')
@@ -201,19 +193,19 @@ class EncyclopediaLinkExtractor:
         
         # Find links that appear in multiple entries
         shared_links = {}
-        for link_url, count in article_link_counter.items():
-            if count >= min_occurrences:
+        for link_url, link_entries in link_to_entries.items():
+            if len(link_entries) >= min_occurrences:
                 article_name = link_url.split('/wiki/')[-1] if '/wiki/' in link_url else link_url
                 article_name = unquote(article_name.replace('_', ' '))
                 
                 shared_links[link_url] = {
-                    'occurrence_count': count,
-                    'entries': link_to_entries[link_url],
+                    'occurrence_count': len(link_entries),
+                    'entries': link_entries,
                     'article_name': article_name
                 }
         
         return {
-            'article_link_counts': dict(article_link_counter),
+            'article_link_counts': {link_url: len(link_entries) for link_url, link_entries in link_to_entries.items()},
             'shared_article_links': shared_links,
             'total_shared_links': len(shared_links)
         }
@@ -5,41 +5,88 @@ Provides functions to validate that encyclopedias have been properly
 populated with definitions, images, descriptions, etc.
 """
 
-from typing import Dict, List, Any
+import re
+import sys
+from typing import Dict, List, Any, Optional, TextIO
+from lxml.etree import _Element
 from encyclopedia.core.encyclopedia import AmiEncyclopedia
 
+# Extracts the Wikipedia File: page URL from a figure_html string
+_FIGURE_HREF_RE = re.compile(r'href=["\']([^"\']*wiki/File:[^"\']*)["\']')
 
-def validate_first_sentences_extracted(encyclopedia: AmiEncyclopedia) -> Dict[str, Any]:
+# Marker for links to Wikimedia file pages; also matches '/wiki/File:'
+_FILE_MARKER = '/File:'
+
+# Placeholder wikidata_id values that do not count as real IDs
+_INVALID_WIKIDATA_IDS = frozenset({'no_wikidata_id', 'invalid_wikidata_id'})
+
+# Number of sample entries kept for reports
+SAMPLE_SIZE_WITH = 5
+SAMPLE_SIZE_WITHOUT = 10
+
+
+def _is_new_sample(key: tuple, seen: set) -> bool:
+    """Record a sample key, returning False if it was already sampled."""
+    if key in seen:
+        return False
+    seen.add(key)
+    return True
+
+
+def _scan_entries(entries: List[Dict]) -> Dict[str, Any]:
     """
-    Validate that first sentences/definitions have been extracted.
-    
-    Checks:
-    - entry['definition_html'] exists and is non-empty
-    - entry['definition_html'] contains <span class="first_sentence_definition">
-    - First sentence is actually extracted (not just full description)
+    Scan entries once, collecting everything the validators report on.
     
     Args:
-        encyclopedia: Encyclopedia to validate
+        entries: Encyclopedia entry dictionaries
         
+    Only the first SAMPLE_SIZE_WITH / SAMPLE_SIZE_WITHOUT distinct
+    (term, wikipedia_url) entries are kept as sample records; the rest are
+    only counted.
+    
     Returns:
         Dictionary with:
-        - total_entries: int
-        - entries_with_definitions: int
-        - entries_without_definitions: List[Dict] (entries missing definitions)
-        - success_rate: float (percentage)
-        - is_valid: bool
-        - sample_with_definitions: List[Dict] (sample entries)
-        - sample_without_definitions: List[Dict] (sample entries)
+        - with_definitions, without_definitions, with_images, without_images: int
+        - sample_with_definitions / sample_without_definitions: List[Dict]
+        - sample_with_images / sample_without_images: List[Dict]
+        - with_wikipedia, with_wikidata, with_descriptions: int
     """
-    total = len(encyclopedia.entries)
-    entries_with_definitions = []
-    entries_without_definitions = []
+    with_definitions = 0
+    without_definitions = 0
+    with_images = 0
+    without_images = 0
+    sample_with_definitions = []
+    sample_without_definitions = []
+    sample_with_images = []
+    sample_without_images = []
+    # (term, wikipedia_url) keys already sampled, per sample list
+    seen_with_definitions = set()
+    seen_without_definitions = set()
+    seen_with_images = set()
+    seen_without_images = set()
+    with_wikipedia = 0
+    with_wikidata = 0
+    with_descriptions = 0
     
-    for entry in encyclopedia.entries:
-        term = entry.get('term', entry.get('canonical_term', 'Unknown'))
-        definition_html = entry.get('definition_html', '')
-        description_html = entry.get('description_html', '')
-        wikipedia_url = entry.get('wikipedia_url', '')
+    for entry in entries:
+        get = entry.get
+        # Only look up canonical_term when term is absent
+        term = get('term')
+        if term is None:
+            term = get('canonical_term', 'Unknown')
+        definition_html = get('definition_html', '')
+        description_html = get('description_html', '')
+        wikipedia_url = get('wikipedia_url', '')
+        wikidata_id = get('wikidata_id')
+        figure_html = get('figure_html')
+        image_link = get('image_link')
+        
+        if wikipedia_url:
+            with_wikipedia += 1
+        if wikidata_id and wikidata_id not in _INVALID_WIKIDATA_IDS:
+            with_wikidata += 1
+        if description_html:
+            with_descriptions += 1
         
         # Check if definition exists and contains first sentence span
         has_definition = (
@@ -48,33 +95,144 @@ def validate_first_sentences_extracted(encyclopedia: AmiEncyclopedia) -> Dict[st
         )
         
         if has_definition:
-            entries_with_definitions.append({
-                'term': term,
-                'definition_preview': definition_html[:100] + '...' if len(definition_html) > 100 else definition_html,
-                'wikipedia_url': wikipedia_url
-            })
+            with_definitions += 1
+            if (len(sample_with_definitions) < SAMPLE_SIZE_WITH
+                    and _is_new_sample((term, wikipedia_url), seen_with_definitions)):
+                sample_with_definitions.append({
+                    'term': term,
+                    'definition_preview': definition_html[:100] + '...' if len(definition_html) > 100 else definition_html,
+                    'wikipedia_url': wikipedia_url
+                })
         else:
-            entries_without_definitions.append({
-                'term': term,
-                'wikipedia_url': wikipedia_url,
-                'has_description_html': bool(description_html),
-                'has_definition_html': bool(definition_html),
-                'description_preview': description_html[:50] + '...' if description_html and len(description_html) > 50 else (description_html or 'None')
-            })
+            without_definitions += 1
+            if (len(sample_without_definitions) < SAMPLE_SIZE_WITHOUT
+                    and _is_new_sample((term, wikipedia_url), seen_without_definitions)):
+                sample_without_definitions.append({
+                    'term': term,
+                    'wikipedia_url': wikipedia_url,
+                    'has_description_html': bool(description_html),
+                    'has_definition_html': bool(definition_html),
+                    'description_preview': description_html[:50] + '...' if description_html and len(description_html) > 50 else (description_html or 'None')
+                })
+        
+        # Check if image link exists
+        has_image = False
+        image_url = None
+        # Elements are tested by type: their truth value reflects child count,
+        # so a text-only <a> link would otherwise look empty
+        is_element = isinstance(figure_html, _Element)
+        
+        if is_element:
+            if figure_html.tag == 'a':
+                href = figure_html.get('href', '')
+                if _FILE_MARKER in href:
+                    has_image = True
+                    image_url = href
+        # Check if it's HTML string
+        elif isinstance(figure_html, str):
+            if 'wikipedia-image-link' in figure_html or '/wiki/File:' in figure_html:
+                has_image = True
+                # Try to extract URL from HTML string
+                url_match = _FIGURE_HREF_RE.search(figure_html)
+                if url_match:
+                    image_url = url_match.group(1)
+        
+        if image_link and _FILE_MARKER in image_link:
+            has_image = True
+            image_url = image_link
+        
+        if has_image:
+            with_images += 1
+            if (len(sample_with_images) < SAMPLE_SIZE_WITH
+                    and _is_new_sample((term, wikipedia_url), seen_with_images)):
+                sample_with_images.append({
+                    'term': term,
+                    'image_url': image_url,
+                    'wikipedia_url': wikipedia_url
+                })
+        else:
+            without_images += 1
+            if (len(sample_without_images) < SAMPLE_SIZE_WITHOUT
+                    and _is_new_sample((term, wikipedia_url), seen_without_images)):
+                sample_without_images.append({
+                    'term': term,
+                    'wikipedia_url': wikipedia_url,
+                    'has_figure_html': figure_html is not None,
+                    'has_image_link': image_link is not None,
+                    'figure_html_type': type(figure_html).__name__ if is_element or figure_html else None
+                })
     
-    success_rate = (len(entries_with_definitions) / total * 100) if total > 0 else 0.0
+    return {
+        'with_definitions': with_definitions,
+        'without_definitions': without_definitions,
+        'with_images': with_images,
+        'without_images': without_images,
+        'sample_with_definitions': sample_with_definitions,
+        'sample_without_definitions': sample_without_definitions,
+        'sample_with_images': sample_with_images,
+        'sample_without_images': sample_without_images,
+        'with_wikipedia': with_wikipedia,
+        'with_wikidata': with_wikidata,
+        'with_descriptions': with_descriptions
+    }
+
+
+def _definition_results(scan: Dict[str, Any], total: int) -> Dict[str, Any]:
+    """Build validate_first_sentences_extracted() results from a scan."""
+    success_rate = (scan['with_definitions'] / total * 100) if total > 0 else 0.0
     
     return {
         'total_entries': total,
-        'entries_with_definitions': len(entries_with_definitions),
-        'entries_without_definitions': len(entries_without_definitions),
+        'entries_with_definitions': scan['with_definitions'],
+        'entries_without_definitions': scan['without_definitions'],
         'success_rate': success_rate,
-        'is_valid': len(entries_without_definitions) == 0,
-        'sample_with_definitions': entries_with_definitions[:5],
-        'sample_without_definitions': entries_without_definitions[:10]
+        'is_valid': scan['without_definitions'] == 0,
+        'sample_with_definitions': scan['sample_with_definitions'],
+        'sample_without_definitions': scan['sample_without_definitions']
     }
 
 
+def _image_results(scan: Dict[str, Any], total: int) -> Dict[str, Any]:
+    """Build validate_image_links_added() results from a scan."""
+    success_rate = (scan['with_images'] / total * 100) if total > 0 else 0.0
+    
+    return {
+        'total_entries': total,
+        'entries_with_images': scan['with_images'],
+        'entries_without_images': scan['without_images'],
+        'success_rate': success_rate,
+        'is_valid': scan['without_images'] == 0,
+        'sample_with_images': scan['sample_with_images'],
+        'sample_without_images': scan['sample_without_images']
+    }
+
+
+def validate_first_sentences_extracted(encyclopedia: AmiEncyclopedia) -> Dict[str, Any]:
+    """
+    Validate that first sentences/definitions have been extracted.
+    
+    Checks:
+    - entry['definition_html'] exists and is non-empty
+    - entry['definition_html'] contains <span class="first_sentence_definition">
+    - First sentence is actually extracted (not just full description)
+    
+    Args:
+        encyclopedia: Encyclopedia to validate
+        
+    Returns:
+        Dictionary with:
+        - total_entries: int
+        - entries_with_definitions: int
+        - entries_without_definitions: int
+        - success_rate: float (percentage)
+        - is_valid: bool
+        - sample_with_definitions: List[Dict] (sample entries)
+        - sample_without_definitions: List[Dict] (sample entries)
+    """
+    entries = encyclopedia.entries
+    return _definition_results(_scan_entries(entries), len(entries))
+
+
 def validate_image_links_added(encyclopedia: AmiEncyclopedia) -> Dict[str, Any]:
     """
     Validate that image links have been added.
@@ -91,74 +249,14 @@ def validate_image_links_added(encyclopedia: AmiEncyclopedia) -> Dict[str, Any]:
         Dictionary with:
         - total_entries: int
         - entries_with_images: int
-        - entries_without_images: List[Dict] (entries missing images)
+        - entries_without_images: int
         - success_rate: float (percentage)
         - is_valid: bool
         - sample_with_images: List[Dict] (sample entries)
         - sample_without_images: List[Dict] (sample entries)
     """
-    total = len(encyclopedia.entries)
-    entries_with_images = []
-    entries_without_images = []
-    
-    for entry in encyclopedia.entries:
-        term = entry.get('term', entry.get('canonical_term', 'Unknown'))
-        figure_html = entry.get('figure_html')
-        image_link = entry.get('image_link')
-        wikipedia_url = entry.get('wikipedia_url', '')
-        
-        # Check if image link exists
-        has_image = False
-        image_url = None
-        
-        if figure_html:
-            # Check if it's an element
-            if hasattr(figure_html, 'tag'):
-                if figure_html.tag == 'a':
-                    href = figure_html.get('href', '')
-                    if '/wiki/File:' in href or '/File:' in href:
-                        has_image = True
-                        image_url = href
-            # Check if it's HTML string
-            elif isinstance(figure_html, str):
-                if 'wikipedia-image-link' in figure_html or '/wiki/File:' in figure_html:
-                    has_image = True
-                    # Try to extract URL from HTML string
-                    import re
-                    url_match = re.search(r'href=["\']([^"\']*wiki/File:[^"\']*)["\']', figure_html)
-                    if url_match:
-                        image_url = url_match.group(1)
-        
-        if image_link and ('/wiki/File:' in image_link or '/File:' in image_link):
-            has_image = True
-            image_url = image_link
-        
-        if has_image:
-            entries_with_images.append({
-                'term': term,
-                'image_url': image_url,
-                'wikipedia_url': wikipedia_url
-            })
-        else:
-            entries_without_images.append({
-                'term': term,
-                'wikipedia_url': wikipedia_url,
-                'has_figure_html': figure_html is not None,
-                'has_image_link': image_link is not None,
-                'figure_html_type': type(figure_html).__name__ if figure_html else None
-            })
-    
-    success_rate = (len(entries_with_images) / total * 100) if total > 0 else 0.0
-    
-    return {
-        'total_entries': total,
-        'entries_with_images': len(entries_with_images),
-        'entries_without_images': len(entries_without_images),
-        'success_rate': success_rate,
-        'is_valid': len(entries_without_images) == 0,
-        'sample_with_images': entries_with_images[:5],
-        'sample_without_images': entries_without_images[:10]
-    }
+    entries = encyclopedia.entries
+    return _image_results(_scan_entries(entries), len(entries))
 
 
 def validate_encyclopedia_completeness(encyclopedia: AmiEncyclopedia) -> Dict[str, Any]:
@@ -172,20 +270,21 @@ def validate_encyclopedia_completeness(encyclopedia: AmiEncyclopedia) -> Dict[st
     - Wikidata IDs
     - Descriptions
     
+    All checks share a single pass over the entries.
+    
     Args:
         encyclopedia: Encyclopedia to validate
         
     Returns:
         Dictionary with validation results for all aspects
     """
-    definition_results = validate_first_sentences_extracted(encyclopedia)
-    image_results = validate_image_links_added(encyclopedia)
-    
-    # Additional validations
     total = len(encyclopedia.entries)
-    entries_with_wikipedia = sum(1 for e in encyclopedia.entries if e.get('wikipedia_url'))
-    entries_with_wikidata = sum(1 for e in encyclopedia.entries if e.get('wikidata_id') and e.get('wikidata_id') not in ('no_wikidata_id', 'invalid_wikidata_id'))
-    entries_with_descriptions = sum(1 for e in encyclopedia.entries if e.get('description_html'))
+    scan = _scan_entries(encyclopedia.entries)
+    definition_results = _definition_results(scan, total)
+    image_results = _image_results(scan, total)
+    entries_with_wikipedia = scan['with_wikipedia']
+    entries_with_wikidata = scan['with_wikidata']
+    entries_with_descriptions = scan['with_descriptions']
     
     return {
         'total_entries': total,
@@ -217,80 +316,94 @@ def validate_encyclopedia_completeness(encyclopedia: AmiEncyclopedia) -> Dict[st
     }
 
 
-def print_validation_report(results: Dict[str, Any], verbose: bool = True) -> None:
+def print_validation_report(
+    results: Dict[str, Any],
+    verbose: bool = True,
+    file: Optional[TextIO] = None
+) -> None:
     """
     Print validation results in a readable format.
     
+    The report is assembled in memory and written in one call.
+    
     Args:
         results: Results dictionary from validate_encyclopedia_completeness()
         verbose: If True, show detailed samples
+        file: Stream to write to (default: sys.stdout)
     """
-    print("\n" + "="*60)
-    print("ENCYCLOPEDIA VALIDATION REPORT")
-    print("="*60)
+    lines = []
+    write = lines.append
+    
+    write("\n" + "="*60)
+    write("ENCYCLOPEDIA VALIDATION REPORT")
+    write("="*60)
     
     total = results['total_entries']
-    print(f"\nTotal entries: {total}")
+    write(f"\nTotal entries: {total}")
     
     # Definitions
     def_results = results['definitions']
-    print(f"\n📝 Definitions (First Sentences):")
-    print(f"  ✓ With definitions: {def_results['entries_with_definitions']}/{total} ({def_results['success_rate']:.1f}%)")
-    print(f"  ✗ Without definitions: {def_results['entries_without_definitions']}/{total}")
+    write(f"\n📝 Definitions (First Sentences):")
+    write(f"  ✓ With definitions: {def_results['entries_with_definitions']}/{total} ({def_results['success_rate']:.1f}%)")
+    write(f"  ✗ Without definitions: {def_results['entries_without_definitions']}/{total}")
     
     if verbose and def_results['sample_without_definitions']:
-        print(f"\n  Sample entries WITHOUT definitions:")
+        write(f"\n  Sample entries WITHOUT definitions:")
         for entry in def_results['sample_without_definitions'][:5]:
-            print(f"    - {entry['term']}")
+            write(f"    - {entry['term']}")
             if entry.get('wikipedia_url'):
-                print(f"      Wikipedia: {entry['wikipedia_url']}")
-            print(f"      Has description_html: {entry.get('has_description_html', False)}")
-            print(f"      Has definition_html: {entry.get('has_definition_html', False)}")
+                write(f"      Wikipedia: {entry['wikipedia_url']}")
+            write(f"      Has description_html: {entry.get('has_description_html', False)}")
+            write(f"      Has definition_html: {entry.get('has_definition_html', False)}")
     
     # Images
     img_results = results['images']
-    print(f"\n🖼️  Image Links:")
-    print(f"  ✓ With images: {img_results['entries_with_images']}/{total} ({img_results['success_rate']:.1f}%)")
-    print(f"  ✗ Without images: {img_results['entries_without_images']}/{total}")
+    write(f"\n🖼️  Image Links:")
+    write(f"  ✓ With images: {img_results['entries_with_images']}/{total} ({img_results['success_rate']:.1f}%)")
+    write(f"  ✗ Without images: {img_results['entries_without_images']}/{total}")
     
     if verbose and img_results['sample_without_images']:
-        print(f"\n  Sample entries WITHOUT images:")
+        write(f"\n  Sample entries WITHOUT images:")
         for entry in img_results['sample_without_images'][:5]:
-            print(f"    - {entry['term']}")
+            write(f"    - {entry['term']}")
             if entry.get('wikipedia_url'):
-                print(f"      Wikipedia: {entry['wikipedia_url']}")
-            print(f"      Has figure_html: {entry.get('has_figure_html', False)}")
-            print(f"      Has image_link: {entry.get('has_image_link', False)}")
+                write(f"      Wikipedia: {entry['wikipedia_url']}")
+            write(f"      Has figure_html: {entry.get('has_figure_html', False)}")
+            write(f"      Has image_link: {entry.get('has_image_link', False)}")
     
     # Wikipedia URLs
     wiki_results = results['wikipedia_urls']
-    print(f"\n🌐 Wikipedia URLs:")
-    print(f"  ✓ With URLs: {wiki_results['with_urls']}/{total} ({wiki_results['success_rate']:.1f}%)")
-    print(f"  ✗ Without URLs: {wiki_results['without_urls']}/{total}")
+    write(f"\n🌐 Wikipedia URLs:")
+    write(f"  ✓ With URLs: {wiki_results['with_urls']}/{total} ({wiki_results['success_rate']:.1f}%)")
+    write(f"  ✗ Without URLs: {wiki_results['without_urls']}/{total}")
     
     # Wikidata IDs
     wd_results = results['wikidata_ids']
-    print(f"\n🔗 Wikidata IDs:")
-    print(f"  ✓ With IDs: {wd_results['with_ids']}/{total} ({wd_results['success_rate']:.1f}%)")
-    print(f"  ✗ Without IDs: {wd_results['without_ids']}/{total}")
+    write(f"\n🔗 Wikidata IDs:")
+    write(f"  ✓ With IDs: {wd_results['with_ids']}/{total} ({wd_results['success_rate']:.1f}%)")
+    write(f"  ✗ Without IDs: {wd_results['without_ids']}/{total}")
     
     # Descriptions
     desc_results = results['descriptions']
-    print(f"\n📄 Descriptions:")
-    print(f"  ✓ With descriptions: {desc_results['with_descriptions']}/{total} ({desc_results['success_rate']:.1f}%)")
-    print(f"  ✗ Without descriptions: {desc_results['without_descriptions']}/{total}")
+    write(f"\n📄 Descriptions:")
+    write(f"  ✓ With descriptions: {desc_results['with_descriptions']}/{total} ({desc_results['success_rate']:.1f}%)")
+    write(f"  ✗ Without descriptions: {desc_results['without_descriptions']}/{total}")
     
     # Overall
-    print(f"\n{'='*60}")
+    write(f"\n{'='*60}")
     if results['overall_valid']:
-        print("✅ VALIDATION PASSED: Encyclopedia is complete")
+        write("✅ VALIDATION PASSED: Encyclopedia is complete")
     else:
-        print("⚠️  VALIDATION WARNINGS: Some entries are missing content")
-        print("\nIssues found:")
+        write("⚠️  VALIDATION WARNINGS: Some entries are missing content")
+        write("\nIssues found:")
         if not def_results['is_valid']:
-            print(f"  - {def_results['entries_without_definitions']} entries missing definitions")
+            write(f"  - {def_results['entries_without_definitions']} entries missing definitions")
         if not img_results['is_valid']:
-            print(f"  - {img_results['entries_without_images']} entries missing images")
+            write(f"  - {img_results['entries_without_images']} entries missing images")
         if wiki_results['without_urls'] > 0:
-            print(f"  - {wiki_results['without_urls']} entries missing Wikipedia URLs")
-    print("="*60 + "\n")
+            write(f"  - {wiki_results['without_urls']} entries missing Wikipedia URLs")
+    write("="*60 + "\n")
+    
+    if file is None:
+        file = sys.stdout
+    file.write('\n'.join(lines) + '\n')
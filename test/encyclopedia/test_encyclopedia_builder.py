@@ -0,0 +1,353 @@
+"""
+Tests for encyclopedia building utilities.
+
+Wikipedia lookups are replaced by fakes so these tests run offline.
+"""
+import threading
+import time
+
+import pytest
+
+from encyclopedia.core.encyclopedia import AmiEncyclopedia
+from encyclopedia.utils import encyclopedia_builder
+from encyclopedia.utils.encyclopedia_builder import (
+    enhance_dictionary_with_wikipedia,
+    add_wikipedia_descriptions_to_encyclopedia,
+    add_image_links_to_encyclopedia,
+    enrich_encyclopedia_full,
+    prefetch_wikipedia_data,
+)
+
+
+def _make_encyclopedia(terms):
+    encyclopedia = AmiEncyclopedia(title="Test")
+    encyclopedia.entries = [{"term": term} for term in terms]
+    return encyclopedia
+
+
+def _fake_wikipedia_feature(entry_dict, encyclopedia):
+    term = entry_dict["term"]
+    if term.startswith("missing"):
+        return
+    entry_dict["wikipedia_url"] = f"https://en.wikipedia.org/wiki/{term}"
+    entry_dict["description_html"] = f"<p>{term} description.</p>"
+    entry_dict["definition_html"] = (
+        f'<span class="first_sentence_definition">{term} description.</span>'
+    )
+
+
+def _fake_images_feature(entry_dict, encyclopedia):
+    term = entry_dict["term"]
+    if term.startswith("missing"):
+        return
+    entry_dict["image_link"] = f"https://en.wikipedia.org/wiki/File:{term}.jpg"
+
+
+class _FakeEntry:
+    def __init__(self):
+        self.pages = []
+
+    def add_wikipedia_page(self, wikipedia_page):
+        self.pages.append(wikipedia_page)
+
+
+class _FakeDictionary:
+    def __init__(self, entry_by_term):
+        self.entry_by_term = entry_by_term
+
+
+class TestEnhanceDictionaryWithWikipedia:
+    """Test Wikipedia enhancement of dictionaries"""
+
+    def test_pages_added_through_entry_method(self, monkeypatch):
+        """Test that looked-up pages are attached to entries"""
+        from amilib.wikimedia import WikipediaPage
+        monkeypatch.setattr(WikipediaPage, "lookup_wikipedia_page_for_term", staticmethod(lambda term: f"page:{term}"))
+        dictionary = _FakeDictionary({"alpha": _FakeEntry(), "beta": _FakeEntry()})
+
+        enhance_dictionary_with_wikipedia(dictionary)
+
+        assert dictionary.entry_by_term["beta"].pages == ["page:beta"]
+
+    def test_lookups_skipped_without_capability(self, monkeypatch):
+        """Test that no lookups happen when pages cannot be attached"""
+        from amilib.wikimedia import WikipediaPage
+
+        def fail_lookup(term):
+            raise AssertionError("lookup should not run")
+
+        monkeypatch.setattr(WikipediaPage, "lookup_wikipedia_page_for_term", staticmethod(fail_lookup))
+        dictionary = _FakeDictionary({"alpha": object()})
+
+        assert enhance_dictionary_with_wikipedia(dictionary) is dictionary
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self._data = data
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._data
+
+
+def _fake_api_get(responses, calls, lead_html=None):
+    def fake_get(url, params=None, **kwargs):
+        calls.append(dict(params))
+        if params["action"] == "parse":
+            return _FakeResponse({"parse": {"title": params["page"], "text": lead_html[params["page"]]}})
+        query_calls = [call for call in calls if call["action"] == "query"]
+        return _FakeResponse(responses[len(query_calls) - 1])
+    return fake_get
+
+
+CLIMATE_API_RESPONSES = [
+    {
+        "continue": {"ppcontinue": 1, "continue": "||"},
+        "query": {
+            "normalized": [{"from": "climate change", "to": "Climate change"}],
+            "redirects": [{"from": "Global warming", "to": "Climate change"}],
+            "pages": [
+                {
+                    "title": "Climate change",
+                    "fullurl": "https://en.wikipedia.org/wiki/Climate_change",
+                    "pageimage": "Global_temperature.svg",
+                },
+                {"title": "Nonexistent term", "missing": True},
+            ],
+        },
+    },
+    {
+        "query": {
+            "pages": [
+                {
+                    "title": "Climate change",
+                    "pageprops": {"wikibase_item": "Q125928"},
+                },
+            ],
+        },
+    },
+]
+
+CLIMATE_LEAD_HTML = {
+    "Climate change": (
+        '<div class="mw-parser-output">'
+        '<p class="mw-empty-elt"></p>'
+        '<table class="infobox"><tr><td><p>Infobox text</p></td></tr></table>'
+        '<p>Climate change is the long-term '
+        '<a href="/wiki/Global_surface_temperature" title="Global surface temperature">shift</a>. '
+        'It is caused by humans.</p>'
+        '<p>More text.</p>'
+        '</div>'
+    ),
+}
+
+
+class TestPrefetchWikipediaData:
+    """Test bulk prefetch of Wikipedia page data"""
+
+    def test_prefetch_merges_continuations_and_resolves_titles(self, monkeypatch):
+        """Test that normalized/redirected titles map back to each term"""
+        calls = []
+        monkeypatch.setattr(
+            encyclopedia_builder.requests, "get", _fake_api_get(CLIMATE_API_RESPONSES, calls, CLIMATE_LEAD_HTML)
+        )
+        entries = [{"term": "climate change"}, {"term": "Global warming"}, {"term": "Nonexistent term"}]
+
+        prefetched = prefetch_wikipedia_data(entries)
+
+        query_calls = [call for call in calls if call["action"] == "query"]
+        parse_calls = [call for call in calls if call["action"] == "parse"]
+        assert len(query_calls) == 2
+        assert query_calls[0]["titles"] == "climate change|Global warming|Nonexistent term"
+        assert query_calls[1]["ppcontinue"] == 1
+        # Both terms resolve to one page, which is parsed once
+        assert [call["page"] for call in parse_calls] == ["Climate change"]
+        assert set(prefetched) == {"climate change", "Global warming", "Climate change"}
+        page = prefetched["Global warming"]
+        assert page["url"] == "https://en.wikipedia.org/wiki/Climate_change"
+        assert page["pageimage"] == "Global_temperature.svg"
+        assert page["wikibase_item"] == "Q125928"
+        assert page["first_para_html"].startswith("<p>Climate change is")
+        assert "More text" not in page["first_para_html"]
+
+    def test_prefetch_uses_stored_url_and_skips_complete_entries(self, monkeypatch):
+        """Test that a stored URL is the lookup title and complete entries are not fetched"""
+        calls = []
+        monkeypatch.setattr(
+            encyclopedia_builder.requests, "get", _fake_api_get(CLIMATE_API_RESPONSES, calls, CLIMATE_LEAD_HTML)
+        )
+        stored_url = "https://en.wikipedia.org/wiki/Global_warming"
+        entries = [
+            {"term": "warming", "wikipedia_url": stored_url},
+            {
+                "term": "albedo",
+                "wikipedia_url": "https://en.wikipedia.org/wiki/Albedo",
+                "description_html": "<p>Albedo is reflectivity.</p>",
+                "figure_html": '<a class="wikipedia-image-link" href="x">x</a>',
+            },
+        ]
+
+        prefetched = prefetch_wikipedia_data(entries)
+        result = encyclopedia_builder.add_wikipedia_description_to_entry(
+            entries[0], None, prefetched=prefetched
+        )
+
+        assert calls[0]["titles"] == "Global warming"
+        assert result["has_description"] is True
+        assert entries[0]["wikipedia_url"] == stored_url
+
+    def test_prefetch_skipped_when_nothing_needed(self, monkeypatch):
+        """Test that no requests are made when every entry is complete"""
+        def fail_get(*args, **kwargs):
+            raise AssertionError("no request expected")
+
+        monkeypatch.setattr(encyclopedia_builder.requests, "get", fail_get)
+        entries = [{"term": "climate change"}]
+
+        assert prefetch_wikipedia_data(entries, descriptions=False, images=False) == {}
+
+    def test_enrich_uses_prefetched_data(self, monkeypatch):
+        """Test that prefetched terms do not trigger per-entry page lookups"""
+        calls = []
+        monkeypatch.setattr(
+            encyclopedia_builder.requests, "get", _fake_api_get(CLIMATE_API_RESPONSES, calls, CLIMATE_LEAD_HTML)
+        )
+
+        def fail_feature(entry_dict, encyclopedia):
+            raise AssertionError("per-entry lookup should not run")
+
+        monkeypatch.setattr(encyclopedia_builder, "add_wikipedia_feature", fail_feature)
+        monkeypatch.setattr(encyclopedia_builder, "add_images_feature", fail_feature)
+        encyclopedia = _make_encyclopedia(["climate change"])
+
+        _, results = enrich_encyclopedia_full(encyclopedia)
+
+        assert results["descriptions"]["with_definitions"] == 1
+        assert results["images"]["with_images"] == 1
+        entry = encyclopedia.entries[0]
+        assert entry["wikidata_id"] == "Q125928"
+        assert "Climate change is the long-term shift.</span>" in entry["definition_html"]
+        assert 'class="wpage_first_para"' in entry["description_html"]
+        # Links in the first paragraph survive the prefetch
+        assert 'href="/wiki/Global_surface_temperature"' in entry["description_html"]
+        assert "More text" not in entry["description_html"]
+        assert "Infobox text" not in entry["description_html"]
+        assert entry["image_link"] == "https://en.wikipedia.org/wiki/File:Global_temperature.svg"
+
+
+class TestAddWikipediaDescriptions:
+    """Test batch addition of Wikipedia descriptions"""
+
+    def test_results_are_counted_per_entry(self, monkeypatch):
+        """Test that successes and missing pages are tallied in batch order"""
+        monkeypatch.setattr(encyclopedia_builder, "add_wikipedia_feature", _fake_wikipedia_feature)
+        terms = ["alpha", "missing_one", "beta", "gamma", "missing_two"]
+        encyclopedia = _make_encyclopedia(terms)
+
+        _, results = add_wikipedia_descriptions_to_encyclopedia(encyclopedia, batch_size=2)
+
+        assert results["total"] == 5
+        assert results["successful"] == 3
+        assert results["with_descriptions"] == 3
+        assert results["with_definitions"] == 3
+        assert [item["term"] for item in results["no_wikipedia"]] == ["missing_one", "missing_two"]
+        assert results["failed"] == []
+        assert encyclopedia.entries[2]["wikipedia_url"].endswith("/beta")
+
+    def test_already_described_entries_are_skipped(self, monkeypatch):
+        """Test that entries with descriptions are counted without a lookup"""
+        looked_up = []
+
+        def recording_feature(entry_dict, encyclopedia):
+            looked_up.append(entry_dict["term"])
+            _fake_wikipedia_feature(entry_dict, encyclopedia)
+
+        monkeypatch.setattr(encyclopedia_builder, "add_wikipedia_feature", recording_feature)
+        encyclopedia = _make_encyclopedia(["alpha", "beta"])
+        encyclopedia.entries[0].update({
+            "wikipedia_url": "https://en.wikipedia.org/wiki/Alpha",
+            "description_html": "<p>Alpha is a letter.</p>",
+        })
+
+        _, results = add_wikipedia_descriptions_to_encyclopedia(encyclopedia)
+
+        assert looked_up == ["beta"]
+        assert results["successful"] == 2
+        assert results["with_descriptions"] == 2
+        assert results["with_definitions"] == 1
+
+    def test_batch_entries_run_concurrently(self, monkeypatch):
+        """Test that entries within a batch are fetched in parallel"""
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def slow_feature(entry_dict, encyclopedia):
+            with lock:
+                active.append(entry_dict["term"])
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(entry_dict["term"])
+            _fake_wikipedia_feature(entry_dict, encyclopedia)
+
+        monkeypatch.setattr(encyclopedia_builder, "add_wikipedia_feature", slow_feature)
+        encyclopedia = _make_encyclopedia([f"term{i}" for i in range(4)])
+
+        _, results = add_wikipedia_descriptions_to_encyclopedia(encyclopedia, batch_size=4)
+
+        assert results["successful"] == 4
+        assert max(peak) > 1
+
+
+class TestAddImageLinks:
+    """Test batch addition of image links"""
+
+    def test_results_are_counted_per_entry(self, monkeypatch):
+        """Test that image links and missing images are tallied"""
+        monkeypatch.setattr(encyclopedia_builder, "add_images_feature", _fake_images_feature)
+        encyclopedia = _make_encyclopedia(["alpha", "missing_one", "beta"])
+
+        _, results = add_image_links_to_encyclopedia(encyclopedia, batch_size=2)
+
+        assert results["successful"] == 2
+        assert results["with_images"] == 2
+        assert [item["term"] for item in results["no_images"]] == ["missing_one"]
+        assert encyclopedia.entries[0]["image_link"].endswith("File:alpha.jpg")
+
+
+class TestPrefetchedImage:
+    """Test image links built from prefetched page images"""
+
+    def test_matches_per_entry_link(self):
+        """Test that the prefetched link equals the one add_images_feature builds"""
+        from encyclopedia.cli.versioned_editor import _create_image_link_element
+        import lxml.etree as ET
+        entry = {"term": "Münster"}
+
+        added = encyclopedia_builder._apply_prefetched_image(entry, {"pageimage": "Münster_(Westf),_Dom.jpg"})
+
+        # The infobox link on the page is percent-encoded in the same way
+        href = "https://en.wikipedia.org/wiki/File:M%C3%BCnster_(Westf),_Dom.jpg"
+        assert added is True
+        assert entry["image_link"] == href
+        assert ET.tostring(entry["figure_html"]) == ET.tostring(_create_image_link_element(href))
+
+    @pytest.mark.filterwarnings("error::FutureWarning")
+    def test_image_url_read_from_prefetched_link(self):
+        """Test that add_image_link_to_entry reports the href of a childless prefetched link"""
+        entry = {"term": "climate", "wikipedia_url": "https://en.wikipedia.org/wiki/Climate"}
+        prefetched = {"Climate": {"pageimage": "Global_temperature.svg"}}
+
+        result = encyclopedia_builder.add_image_link_to_entry(entry, None, prefetched=prefetched)
+
+        assert result["success"] is True
+        assert result["has_image_link"] is True
+        assert result["image_url"] == entry["figure_html"].get("href")
+        assert result["image_url"] == "https://en.wikipedia.org/wiki/File:Global_temperature.svg"
+
+        # A second call treats the childless link as an existing image
+        assert encyclopedia_builder.add_image_link_to_entry(entry, None, prefetched={})["has_image_link"] is True
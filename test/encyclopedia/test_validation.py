@@ -0,0 +1,151 @@
+"""
+Tests for encyclopedia validation utilities.
+"""
+import io
+
+import pytest
+from lxml import etree as ET
+
+from encyclopedia.core.encyclopedia import AmiEncyclopedia
+from encyclopedia.utils.validation import (
+    print_validation_report,
+    validate_encyclopedia_completeness,
+    validate_first_sentences_extracted,
+    validate_image_links_added,
+)
+
+
+def _image_link_element(href):
+    link = ET.Element("a")
+    link.attrib["href"] = href
+    link.attrib["class"] = "wikipedia-image-link"
+    ET.SubElement(link, "img").attrib["src"] = "https://upload.wikimedia.org/image.png"
+    return link
+
+
+@pytest.fixture
+def encyclopedia():
+    """Encyclopedia with a mix of complete and incomplete entries"""
+    encyclopedia = AmiEncyclopedia(title="Test")
+    encyclopedia.entries = [
+        {
+            "term": "climate",
+            "wikipedia_url": "https://en.wikipedia.org/wiki/Climate",
+            "wikidata_id": "Q7937",
+            "definition_html": '<span class="first_sentence_definition">Climate is weather.</span>',
+            "description_html": "<p>Climate is weather.</p>",
+            "figure_html": _image_link_element("https://en.wikipedia.org/wiki/File:Climate.png"),
+        },
+        {
+            "canonical_term": "albedo",
+            "wikipedia_url": "https://en.wikipedia.org/wiki/Albedo",
+            "wikidata_id": "no_wikidata_id",
+            "description_html": "<p>Albedo is reflectivity.</p>",
+            "figure_html": '<a class="wikipedia-image-link" href="https://en.wikipedia.org/wiki/File:Albedo.svg">x</a>',
+        },
+        {
+            "term": "aerosol",
+            "wikidata_id": "Q104541",
+            "image_link": "https://commons.wikimedia.org/File:Aerosol.jpg",
+        },
+        {
+            "term": "methane",
+        },
+    ]
+    return encyclopedia
+
+
+class TestValidation:
+    """Test suite for encyclopedia validation"""
+
+    def test_definitions(self, encyclopedia):
+        """Test that only entries with a first-sentence span count as defined"""
+        results = validate_first_sentences_extracted(encyclopedia)
+
+        assert results["total_entries"] == 4
+        assert results["entries_with_definitions"] == 1
+        assert results["entries_without_definitions"] == 3
+        assert results["success_rate"] == 25.0
+        assert results["is_valid"] is False
+        assert [e["term"] for e in results["sample_without_definitions"]] == ["albedo", "aerosol", "methane"]
+        assert results["sample_without_definitions"][0]["has_description_html"] is True
+
+    def test_images(self, encyclopedia):
+        """Test that element, string and URL image links are all recognised"""
+        results = validate_image_links_added(encyclopedia)
+
+        assert results["entries_with_images"] == 3
+        assert [e["image_url"] for e in results["sample_with_images"]] == [
+            "https://en.wikipedia.org/wiki/File:Climate.png",
+            "https://en.wikipedia.org/wiki/File:Albedo.svg",
+            "https://commons.wikimedia.org/File:Aerosol.jpg",
+        ]
+        assert results["sample_without_images"][0]["term"] == "methane"
+        assert results["sample_without_images"][0]["has_figure_html"] is False
+
+    def test_text_only_link_element(self):
+        """Test that a text-only <a> element, as made by add_images_feature, counts as an image"""
+        link = ET.Element("a")
+        link.attrib["href"] = "https://en.wikipedia.org/wiki/File:Ozone.png"
+        link.text = "Ozone.png"
+        encyclopedia = AmiEncyclopedia(title="Test")
+        encyclopedia.entries = [{"term": "ozone", "figure_html": link}]
+
+        results = validate_image_links_added(encyclopedia)
+
+        assert results["entries_with_images"] == 1
+        assert results["sample_with_images"][0]["image_url"].endswith("File:Ozone.png")
+
+    def test_completeness(self, encyclopedia):
+        """Test that the combined report counts every aspect"""
+        results = validate_encyclopedia_completeness(encyclopedia)
+
+        assert results["wikipedia_urls"]["with_urls"] == 2
+        assert results["wikidata_ids"]["with_ids"] == 2
+        assert results["descriptions"]["with_descriptions"] == 2
+        assert results["definitions"] == validate_first_sentences_extracted(encyclopedia)
+        assert results["images"] == validate_image_links_added(encyclopedia)
+        assert results["overall_valid"] is False
+
+    def test_samples_are_capped(self):
+        """Test that large encyclopedias keep counts but only a few samples"""
+        encyclopedia = AmiEncyclopedia(title="Large")
+        encyclopedia.entries = [{"term": f"term{i}"} for i in range(25)]
+
+        results = validate_first_sentences_extracted(encyclopedia)
+
+        assert results["entries_without_definitions"] == 25
+        assert len(results["sample_without_definitions"]) == 10
+        assert results["sample_without_definitions"][0]["term"] == "term0"
+
+    def test_samples_skip_duplicate_entries(self):
+        """Test that repeated (term, wikipedia_url) entries are sampled once"""
+        encyclopedia = AmiEncyclopedia(title="Merged")
+        encyclopedia.entries = [{"term": "ozone"}] * 12 + [{"term": "smog"}]
+
+        results = validate_image_links_added(encyclopedia)
+
+        assert results["entries_without_images"] == 13
+        assert [e["term"] for e in results["sample_without_images"]] == ["ozone", "smog"]
+
+    def test_empty_encyclopedia(self):
+        """Test that an empty encyclopedia reports zero rates"""
+        results = validate_encyclopedia_completeness(AmiEncyclopedia(title="Empty"))
+
+        assert results["total_entries"] == 0
+        assert results["definitions"]["success_rate"] == 0.0
+        assert results["images"]["is_valid"] is True
+        assert results["overall_valid"] is False
+
+    def test_print_report_to_stream(self, encyclopedia):
+        """Test that the report can be written to a supplied stream"""
+        results = validate_encyclopedia_completeness(encyclopedia)
+        stream = io.StringIO()
+
+        print_validation_report(results, verbose=True, file=stream)
+
+        report = stream.getvalue()
+        assert "ENCYCLOPEDIA VALIDATION REPORT" in report
+        assert "With definitions: 1/4 (25.0%)" in report
+        assert "    - methane" in report
+        assert report.endswith("=" * 60 + "\n\n")
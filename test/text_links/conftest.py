@@ -0,0 +1,13 @@
+"""
+Pytest configuration for text links tests.
+"""
+
+import pytest
+from test.text_links.test_config import CURRENT_ENCYCLOPEDIA_FILE
+from test.text_links.link_extractor import EncyclopediaLinkExtractor
+
+
+@pytest.fixture(scope="session")
+def encyclopedia_entries():
+    """Entries of the current encyclopedia file, parsed once per session (treat as read-only)"""
+    return EncyclopediaLinkExtractor().extract_entries_from_path(CURRENT_ENCYCLOPEDIA_FILE)
@@ -1,109 +1,197 @@
 """
 Create bipartite network graph from encyclopedia shared links
 Output formats: GEXF (recommended), GraphML, JSON, CSV
+Pickled graph (.pkl.gz) for fast reloading in Python
 """
 
 import networkx as nx
+from networkx.algorithms import approximation
+import gzip
 import json
+import pickle
+from collections import Counter
 from pathlib import Path
 from typing import Dict, Set, Tuple
 
-def create_bipartite_graph_from_json(json_file: Path) -> Tuple[nx.Graph, Set[str], Set[str]]:
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _load_json(json_file: Path) -> Dict:
+    """Parse a JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(json_file, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(json_file, 'r') as f:
+        return json.load(f)
+
+
+def _edge_key(edges: Dict, u: str, v: str) -> Tuple[str, str]:
+    """Key for undirected edge u-v, reusing the orientation already stored in edges"""
+    return (v, u) if (v, u) in edges else (u, v)
+
+
+def create_bipartite_graph_from_json(json_file: Path, data: Dict = None) -> Tuple[nx.Graph, Set[str], Set[str]]:
     """
     Load shared links JSON and create bipartite network graph.
     
     Args:
         json_file: Path to shared_article_links.json
+        data: Parsed content of json_file, if the caller has already loaded it
         
     Returns:
         Tuple of (Graph, entry_names, target_articles)
     """
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+    if data is None:
+        data = _load_json(json_file)
     
-    # Create bipartite graph
-    B = nx.Graph()
+    # Collect nodes and edges in plain dicts, then insert them in bulk;
+    # dict order keeps the graph's node and edge order as first seen
     entry_names = set()
     target_articles = set()
+    node_attrs = {}
+    edge_attrs = {}
     
-    # Add nodes and edges
     for link_url, link_info in data['shared_article_links'].items():
         article_name = link_info['article_name']
         target_articles.add(article_name)
         
-        # Add target node with metadata
-        if not B.has_node(article_name):
-            B.add_node(article_name, bipartite=1, node_type='target', 
-                      occurrence_count=link_info['occurrence_count'])
+        # Target node with metadata (first occurrence wins)
+        node_attrs.setdefault(article_name, {'bipartite': 1, 'node_type': 'target',
+                                             'occurrence_count': link_info['occurrence_count']})
         
         for entry in link_info['entries']:
             entry_term = entry['term']
             entry_names.add(entry_term)
             
-            # Add entry node
-            if not B.has_node(entry_term):
-                B.add_node(entry_term, bipartite=0, node_type='entry')
+            # Entry node
+            node_attrs.setdefault(entry_term, {'bipartite': 0, 'node_type': 'entry'})
             
-            # Add edge with weight
-            if B.has_edge(entry_term, article_name):
-                B[entry_term][article_name]['weight'] += 1
+            # Edge with weight
+            edge = _edge_key(edge_attrs, entry_term, article_name)
+            if edge in edge_attrs:
+                edge_attrs[edge]['weight'] += 1
             else:
-                B.add_edge(entry_term, article_name, weight=1,
-                           link_text=entry.get('link_text', ''),
-                           title=entry.get('title', ''))
+                edge_attrs[edge] = {'weight': 1,
+                                    'link_text': entry.get('link_text', ''),
+                                    'title': entry.get('title', '')}
+    
+    B = nx.Graph()
+    B.add_nodes_from(node_attrs.items())
+    B.add_edges_from((u, v, attrs) for (u, v), attrs in edge_attrs.items())
     
     return B, entry_names, target_articles
 
 
-def export_to_multiple_formats(graph: nx.Graph, base_path: Path):
-    """Export network graph to multiple formats"""
+EXPORT_FORMATS = ('gexf', 'graphml', 'edgelist', 'adjlist', 'stats')
+# Exact clustering is O(n * degree^2); larger graphs get a sampled estimate
+EXACT_CLUSTERING_MAX_NODES = 10_000
+CLUSTERING_TRIALS = 1000
+
+
+def average_clustering(graph: nx.Graph) -> float:
+    """Average clustering coefficient, estimated by sampling for large graphs"""
+    if graph.number_of_nodes() > EXACT_CLUSTERING_MAX_NODES:
+        return approximation.average_clustering(graph, trials=CLUSTERING_TRIALS, seed=0)
+    return nx.average_clustering(graph)
+
+
+def export_to_multiple_formats(graph: nx.Graph, base_path: Path, formats: Set[str] = None):
+    """Export network graph to multiple formats
+    
+    Each writer walks the whole graph, so only the requested formats are written.
+    
+    Args:
+        graph: Graph to export
+        base_path: Path of the source JSON; outputs are named after it
+        formats: Subset of EXPORT_FORMATS to write (default: all)
+        
+    Returns:
+        Tuple of (gexf, graphml, csv, adjlist, stats) paths; None for formats not written
+    """
+    formats = set(EXPORT_FORMATS) if formats is None else set(formats)
+    unknown = formats.difference(EXPORT_FORMATS)
+    if unknown:
+        raise ValueError(f"Unknown export formats: {sorted(unknown)}")
+    gexf_file = graphml_file = csv_file = adjlist_file = stats_file = None
     
     # 1. GEXF (recommended for Gephi)
-    gexf_file = Path(str(base_path).replace('.json', '.gexf'))
-    nx.write_gexf(graph, gexf_file)
-    print(f"✓ GEXF format: {gexf_file}")
+    if 'gexf' in formats:
+        gexf_file = Path(str(base_path).replace('.json', '.gexf'))
+        nx.write_gexf(graph, gexf_file)
+        print(f"✓ GEXF format: {gexf_file}")
     
     # 2. GraphML (generic graph format)
-    graphml_file = Path(str(base_path).replace('.json', '.graphml'))
-    nx.write_graphml(graph, graphml_file)
-    print(f"✓ GraphML format: {graphml_file}")
+    if 'graphml' in formats:
+        graphml_file = Path(str(base_path).replace('.json', '.graphml'))
+        nx.write_graphml(graph, graphml_file)
+        print(f"✓ GraphML format: {graphml_file}")
     
     # 3. Edge list CSV
-    csv_file = Path(str(base_path).replace('.json', '_edges.csv'))
-    nx.write_edgelist(graph, csv_file, delimiter=',')
-    print(f"✓ Edge list CSV: {csv_file}")
+    if 'edgelist' in formats:
+        csv_file = Path(str(base_path).replace('.json', '_edges.csv'))
+        nx.write_edgelist(graph, csv_file, delimiter=',')
+        print(f"✓ Edge list CSV: {csv_file}")
     
     # 4. Multi-line adjacency list
-    adjlist_file = Path(str(base_path).replace('.json', '_adjlist.txt'))
-    nx.write_multiline_adjlist(graph, adjlist_file)
-    print(f"✓ Adjacency list: {adjlist_file}")
+    if 'adjlist' in formats:
+        adjlist_file = Path(str(base_path).replace('.json', '_adjlist.txt'))
+        nx.write_multiline_adjlist(graph, adjlist_file)
+        print(f"✓ Adjacency list: {adjlist_file}")
     
     # 5. Network statistics
-    stats_file = Path(str(base_path).replace('.json', '_network_stats.json'))
-    stats = {
-        'total_nodes': graph.number_of_nodes(),
-        'total_edges': graph.number_of_edges(),
-        'is_bipartite': nx.is_bipartite(graph),
-        'density': nx.density(graph),
-        'average_clustering': nx.average_clustering(graph),
-        'number_connected_components': nx.number_connected_components(graph),
-    }
-    
-    with open(stats_file, 'w') as f:
-        json.dump(stats, f, indent=2)
-    print(f"✓ Network statistics: {stats_file}")
+    if 'stats' in formats:
+        stats_file = Path(str(base_path).replace('.json', '_network_stats.json'))
+        stats = {
+            'total_nodes': graph.number_of_nodes(),
+            'total_edges': graph.number_of_edges(),
+            'is_bipartite': nx.is_bipartite(graph),
+            'density': nx.density(graph),
+            'average_clustering': average_clustering(graph),
+            'number_connected_components': nx.number_connected_components(graph),
+        }
+        
+        with open(stats_file, 'w') as f:
+            json.dump(stats, f, indent=2)
+        print(f"✓ Network statistics: {stats_file}")
     
     return gexf_file, graphml_file, csv_file, adjlist_file, stats_file
 
 
-def create_filtered_graph(json_file: Path, min_occurrences: int = 5) -> nx.Graph:
-    """Create filtered graph with only highly-shared articles"""
-    with open(json_file, 'r') as f:
-        data = json.load(f)
+def export_to_pickle(graph: nx.Graph, base_path: Path) -> Path:
+    """Save graph as gzipped pickle; reloading skips the XML parse of GEXF/GraphML
+    
+    Args:
+        graph: Graph to save
+        base_path: Path of the source JSON; output is named after it
+        
+    Returns:
+        Path to the .pkl.gz file
+    """
+    pickle_file = Path(str(base_path).replace('.json', '.pkl.gz'))
+    with gzip.open(pickle_file, 'wb') as f:
+        pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+    print(f"✓ Pickled graph: {pickle_file}")
+    return pickle_file
+
+
+def load_graph_pickle(pickle_file: Path) -> nx.Graph:
+    """Load a graph saved by export_to_pickle (only load files you created)"""
+    with gzip.open(pickle_file, 'rb') as f:
+        return pickle.load(f)
+
+
+def create_filtered_graph(json_file: Path, min_occurrences: int = 5, data: Dict = None) -> nx.Graph:
+    """Create filtered graph with only highly-shared articles (data: already-parsed json_file, optional)"""
+    if data is None:
+        data = _load_json(json_file)
     
-    B = nx.Graph()
     entry_names = set()
     target_articles = set()
+    node_attrs = {}
+    edge_counts = Counter()
     
     # Filter by minimum occurrences
     for link_url, link_info in data['shared_article_links'].items():
@@ -111,20 +199,20 @@ def create_filtered_graph(json_file: Path, min_occurrences: int = 5) -> nx.Graph
             article_name = link_info['article_name']
             target_articles.add(article_name)
             
-            B.add_node(article_name, bipartite=1, node_type='target',
-                      occurrence_count=link_info['occurrence_count'])
+            # Target attributes always apply, as add_node on an existing node did
+            node_attrs.setdefault(article_name, {}).update(
+                bipartite=1, node_type='target', occurrence_count=link_info['occurrence_count'])
             
             for entry in link_info['entries']:
                 entry_term = entry['term']
                 entry_names.add(entry_term)
                 
-                if not B.has_node(entry_term):
-                    B.add_node(entry_term, bipartite=0, node_type='entry')
-                
-                if B.has_edge(entry_term, article_name):
-                    B[entry_term][article_name]['weight'] += 1
-                else:
-                    B.add_edge(entry_term, article_name, weight=1)
+                node_attrs.setdefault(entry_term, {'bipartite': 0, 'node_type': 'entry'})
+                edge_counts[_edge_key(edge_counts, entry_term, article_name)] += 1
+    
+    B = nx.Graph()
+    B.add_nodes_from(node_attrs.items())
+    B.add_weighted_edges_from((u, v, weight) for (u, v), weight in edge_counts.items())
     
     return B, entry_names, target_articles
 
@@ -140,9 +228,8 @@ def main():
     
     for json_file in json_files:
         try:
-            # Validate file structure
-            with open(json_file, 'r') as f:
-                data = json.load(f)
+            # Validate file structure; the parsed data is reused for every graph
+            data = _load_json(json_file)
             if 'shared_article_links' not in data:
                 print(f"Skipping {json_file.name} - not a shared links file")
                 continue
@@ -153,16 +240,22 @@ def main():
         print(f"\nProcessing: {json_file}")
         
         # Create full bipartite graph
-        B, entries, targets = create_bipartite_graph_from_json(json_file)
+        B, entries, targets = create_bipartite_graph_from_json(json_file, data=data)
         print(f"Nodes: {B.number_of_nodes()} (entries: {len(entries)}, targets: {len(targets)})")
         print(f"Edges: {B.number_of_edges()}")
         
         # Export to all formats
         export_to_multiple_formats(B, json_file)
+        export_to_pickle(B, json_file)
         
-        # Create filtered versions (only highly-shared articles)
+        # Create filtered versions (only highly-shared articles); thresholds ascend,
+        # so each one only rescans the links that passed the previous one
+        shared_links = data['shared_article_links']
         for min_occ in [10, 20]:
-            B_filtered, _, _ = create_filtered_graph(json_file, min_occurrences=min_occ)
+            shared_links = {url: info for url, info in shared_links.items()
+                            if info['occurrence_count'] >= min_occ}
+            B_filtered, _, _ = create_filtered_graph(json_file, min_occurrences=min_occ,
+                                                     data={'shared_article_links': shared_links})
             if B_filtered.number_of_nodes() > 0:
                 filtered_file = json_file.parent / json_file.stem
                 filtered_gexf = f"{filtered_file}_filtered_{min_occ}.gexf"
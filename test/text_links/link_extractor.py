@@ -3,34 +3,152 @@ Modular link extraction utilities for encyclopedia analysis
 Reusable components for ../amilib integration
 """
 
+import mmap
+import os
 import re
 import requests
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from typing import Dict, List, Optional, Tuple
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+# Compiled XPath for the extraction hot path; tree walking stays in C
+# Encyclopedia files carry no charset declaration, so bytes input is parsed as UTF-8
+UTF8_HTML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+
+DICTIONARY_XPATH = etree.XPath("//div[@role='ami_dictionary']")
+ENTRY_XPATH = etree.XPath(".//div[@role='ami_entry']")
+SEARCH_P_XPATH = etree.XPath(".//p[contains(., 'search term:')]")
+HREF_LINK_XPATH = etree.XPath(".//a[@href]")
+# Citation links are never wanted, so drop them inside the XPath engine
+DESCRIPTION_LINK_XPATH = etree.XPath(".//a[@href and not(starts-with(@href, '#cite'))]")
+DESCRIPTION_XPATH = etree.XPath(
+    ".//p[contains(concat(' ', normalize-space(@class), ' '), ' wpage_first_para ')]")
+
+# One match per href; alternatives are tried in order, so File: and Help: win over /wiki/
+LINK_TYPE_RE = re.compile(
+    r'(?P<file>/wiki/File:)|(?P<help>/wiki/Help:)|(?P<article>/wiki/)|(?P<external>http)|(?P<anchor>#)')
+
+# Link types collected by extract_all_link_targets, and the key each is returned under
+TARGET_BUCKETS = {
+    'article': 'article_links',
+    'file': 'file_links',
+    'help': 'help_links',
+    'external': 'external_links'
+}
+
+# Number of parsed HTML files kept for repeated extraction across extractors
+ENTRIES_CACHE_SIZE = 4
+# Entries parsed from files, keyed on (path, mtime, size), least recently used first
+_ENTRIES_CACHE: "OrderedDict[Tuple[str, int, int], List[Dict]]" = OrderedDict()
+
+
+@lru_cache(maxsize=4096)
+def _normalize_wikipedia_url(url: str) -> str:
+    """Normalize Wikipedia URL to canonical format; the same targets recur across entries"""
+    parsed = urlparse(url)
+    if parsed.netloc == 'en.wikipedia.org':
+        if parsed.path.startswith('/wiki/'):
+            return f"https://en.wikipedia.org{parsed.path}{parsed.fragment}"
+    return url
+
+
+def _create_session(user_agent: str, cache_name: Optional[str] = None) -> requests.Session:
+    """Session with pooled keep-alive connections and retries on transient errors
+    
+    Once retries run out the last response is returned, so callers still see its status code.
+    With cache_name and requests-cache installed, GET and HEAD responses are kept
+    in that SQLite cache for an hour and revalidated with conditional requests.
+    """
+    if cache_name and requests_cache is not None:
+        session = requests_cache.CachedSession(
+            cache_name, expire_after=3600, allowable_methods=('GET', 'HEAD'))
+    else:
+        session = requests.Session()
+    session.headers.update({'User-Agent': user_agent})
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 502, 503, 504],
+                          raise_on_status=False),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _copy_entries(entries: List[Dict]) -> List[Dict]:
+    """Copy extracted entries deep enough that callers can mutate them freely"""
+    return [
+        {**entry, 'description_links': [
+            {**link, 'class': list(link['class'])} for link in entry['description_links']
+        ]}
+        for entry in entries
+    ]
+
+
+def _stripped_text(element) -> str:
+    """Text of element with each text node stripped and joined, like get_text(strip=True)"""
+    return ''.join(text.strip() for text in element.itertext())
+
 
 class EncyclopediaLinkExtractor:
     """Extract and analyze links from encyclopedia HTML"""
     
-    def __init__(self, base_url: str = "https://en.wikipedia.org/wiki/"):
+    def __init__(self, base_url: str = "https://en.wikipedia.org/wiki/", cache_name: Optional[str] = None):
         self.base_url = base_url
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Encyclopedia Link Extractor/1.0'
-        })
+        self.session = _create_session('Encyclopedia Link Extractor/1.0', cache_name)
     
     def extract_entries(self, html_content: str) -> List[Dict]:
         """Extract all encyclopedia entries from HTML"""
-        soup = BeautifulSoup(html_content, 'html.parser')
-        dictionary = soup.find('div', {'role': 'ami_dictionary'})
+        return self._parse_entries(html_content)
+    
+    def extract_entries_from_path(self, path: Path) -> List[Dict]:
+        """Extract all encyclopedia entries from a UTF-8 HTML file without decoding it to str
+        
+        Entries are cached per file until it changes on disk, so repeated
+        extraction by any extractor parses once; callers get their own copies.
+        """
+        stat = os.stat(path)
+        if stat.st_size == 0:
+            # mmap cannot map an empty file, and it holds no entries anyway
+            return []
+        key = (os.path.realpath(path), stat.st_mtime_ns, stat.st_size)
+        cached = _ENTRIES_CACHE.get(key)
+        if cached is None:
+            with open(path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as html_bytes:
+                    cached = _ENTRIES_CACHE[key] = self._parse_entries(html_bytes)
+            if len(_ENTRIES_CACHE) > ENTRIES_CACHE_SIZE:
+                _ENTRIES_CACHE.popitem(last=False)
+        else:
+            _ENTRIES_CACHE.move_to_end(key)
+        return _copy_entries(cached)
+    
+    def _parse_entries(self, html_content) -> List[Dict]:
+        """Parse the dictionary container and extract each entry"""
+        if isinstance(html_content, str):
+            root = lxml_html.document_fromstring(html_content)
+        else:
+            root = lxml_html.document_fromstring(html_content, parser=UTF8_HTML_PARSER)
+        dictionaries = DICTIONARY_XPATH(root)
         
-        if not dictionary:
+        if not dictionaries:
             raise ValueError("No dictionary container found")
         
         entries = []
-        for entry_div in dictionary.find_all('div', {'role': 'ami_entry'}):
+        for entry_div in ENTRY_XPATH(dictionaries[0]):
             entry = self._extract_single_entry(entry_div)
             if entry:
                 entries.append(entry)
@@ -44,24 +162,21 @@ class EncyclopediaLinkExtractor:
             name = entry_div.get('name', '')
             
             # Extract search URL
-            search_p = None
-            for p in entry_div.find_all('p'):
-                if p.get_text() and 'search term:' in p.get_text():
-                    search_p = p
-                    break
-            
             search_url = ""
-            if search_p:
-                search_link = search_p.find('a', href=True)
-                if search_link:
-                    search_url = search_link['href']
+            search_ps = SEARCH_P_XPATH(entry_div)
+            if search_ps:
+                search_links = HREF_LINK_XPATH(search_ps[0])
+                if search_links:
+                    search_url = search_links[0].get('href')
             
             # Extract description
-            desc_p = entry_div.find('p', class_='wpage_first_para')
-            description_html = str(desc_p) if desc_p else ""
+            desc_ps = DESCRIPTION_XPATH(entry_div)
+            desc_p = desc_ps[0] if desc_ps else None
+            description_html = etree.tostring(
+                desc_p, encoding='unicode', method='html', with_tail=False) if desc_p is not None else ""
             
             # Extract links from description
-            links = self._extract_description_links(desc_p) if desc_p else []
+            links = self._extract_description_links(desc_p)
             
             return {
                 'term': term,
@@ -77,22 +192,16 @@ class EncyclopediaLinkExtractor:
     def _extract_description_links(self, desc_element) -> List[Dict]:
         """Extract all links from description paragraph"""
         links = []
-        if not desc_element:
+        if desc_element is None:
             return links
         
-        for link in desc_element.find_all('a', href=True):
-            href = link['href']
-            text = link.get_text(strip=True)
-            
-            # Skip citation links
-            if href.startswith('#cite'):
-                continue
-            
+        for link in DESCRIPTION_LINK_XPATH(desc_element):
+            href = link.get('href')
             link_info = {
                 'href': href,
-                'text': text,
+                'text': _stripped_text(link),
                 'title': link.get('title', ''),
-                'class': link.get('class', [])
+                'class': link.get('class', '').split()
             }
             
             # Classify link type
@@ -103,18 +212,8 @@ class EncyclopediaLinkExtractor:
     
     def _classify_link_type(self, href: str) -> str:
         """Classify link type based on href pattern"""
-        if href.startswith('/wiki/File:'):
-            return 'file'
-        elif href.startswith('/wiki/Help:'):
-            return 'help'
-        elif href.startswith('/wiki/'):
-            return 'article'
-        elif href.startswith('http'):
-            return 'external'
-        elif href.startswith('#'):
-            return 'anchor'
-        else:
-            return 'unknown'
+        match = LINK_TYPE_RE.match(href)
+        return match.lastgroup if match else 'unknown'
     
     def resolve_search_url(self, search_url: str, timeout: int = 30) -> Tuple[str, int]:
         """Follow search URL redirect to get canonical article URL"""
@@ -127,53 +226,35 @@ class EncyclopediaLinkExtractor:
     
     def normalize_wikipedia_url(self, url: str) -> str:
         """Normalize Wikipedia URL to canonical format"""
-        parsed = urlparse(url)
-        if parsed.netloc == 'en.wikipedia.org':
-            if parsed.path.startswith('/wiki/'):
-                return f"https://en.wikipedia.org{parsed.path}{parsed.fragment}"
-        return url
+        return _normalize_wikipedia_url(url)
     
     def extract_all_link_targets(self, entries: List[Dict]) -> Dict[str, List[str]]:
         """Extract all unique link targets from entries"""
-        targets = {
-            'search_urls': [],
-            'article_links': [],
-            'file_links': [],
-            'help_links': [],
-            'external_links': []
-        }
+        # Dicts dedupe on insert and keep first-seen order
+        search_urls = {}
+        buckets_by_type = {link_type: {} for link_type in TARGET_BUCKETS}
         
         for entry in entries:
             # Search URLs
             if entry.get('search_url'):
-                targets['search_urls'].append(entry['search_url'])
+                search_urls[entry['search_url']] = None
             
             # Description links
             for link in entry.get('description_links', []):
-                link_type = link.get('type', 'unknown')
-                href = link['href']
-                
-                if link_type == 'article':
-                    targets['article_links'].append(href)
-                elif link_type == 'file':
-                    targets['file_links'].append(href)
-                elif link_type == 'help':
-                    targets['help_links'].append(href)
-                elif link_type == 'external':
-                    targets['external_links'].append(href)
-        
-        # Remove duplicates
-        for key in targets:
-            targets[key] = list(set(targets[key]))
+                bucket = buckets_by_type.get(link.get('type', 'unknown'))
+                if bucket is not None:
+                    bucket[link['href']] = None
         
+        targets = {'search_urls': list(search_urls)}
+        for link_type, key in TARGET_BUCKETS.items():
+            targets[key] = list(buckets_by_type[link_type])
         return targets
 
     def find_shared_article_links(self, entries, min_occurrences=2):
         """Find article links that appear in multiple entries"""
-        from collections import Counter
         import urllib.parse
         
-        article_link_counter = Counter()
+        # Each occurrence is one record, so the list length is the occurrence count
         link_to_entries = {}
         
         for entry in entries:
@@ -186,11 +267,7 @@ class EncyclopediaLinkExtractor:
                         f"https://en.wikipedia.org{href}" if href.startswith('/wiki/') else href
                     )
                     
-                    article_link_counter[normalized_href] += 1
-                    
-                    if normalized_href not in link_to_entries:
-                        link_to_entries[normalized_href] = []
-                    link_to_entries[normalized_href].append({
+                    link_to_entries.setdefault(normalized_href, []).append({
                         'term': entry_term,
                         'link_text': link.get('text', ''),
                         'title': link.get('title', '')
@@ -198,19 +275,19 @@ class EncyclopediaLinkExtractor:
         
         # Find links that appear in multiple entries
         shared_links = {}
-        for link_url, count in article_link_counter.items():
-            if count >= min_occurrences:
+        for link_url, link_entries in link_to_entries.items():
+            if len(link_entries) >= min_occurrences:
                 article_name = link_url.split('/wiki/')[-1] if '/wiki/' in link_url else link_url
                 article_name = urllib.parse.unquote(article_name.replace('_', ' '))
                 
                 shared_links[link_url] = {
-                    'occurrence_count': count,
-                    'entries': link_to_entries[link_url],
+                    'occurrence_count': len(link_entries),
+                    'entries': link_entries,
                     'article_name': article_name
                 }
         
         return {
-            'article_link_counts': dict(article_link_counter),
+            'article_link_counts': {link_url: len(link_entries) for link_url, link_entries in link_to_entries.items()},
             'shared_article_links': shared_links,
             'total_shared_links': len(shared_links)
         }
@@ -218,36 +295,44 @@ class EncyclopediaLinkExtractor:
 class LinkValidator:
     """Validate extracted links and their targets"""
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Encyclopedia Link Validator/1.0'
-        })
+    def __init__(self, max_workers: int = 16, cache_name: Optional[str] = None):
+        self.max_workers = max_workers
+        self.session = _create_session('Encyclopedia Link Validator/1.0', cache_name)
+    
+    def _head(self, link: str, timeout: int) -> Dict:
+        """HEAD a single link and return its status information"""
+        try:
+            if link.startswith('/wiki/'):
+                full_url = f"https://en.wikipedia.org{link}"
+            else:
+                full_url = link
+            
+            response = self.session.head(full_url, timeout=timeout)
+            return {
+                'status_code': response.status_code,
+                'final_url': response.url,
+                'accessible': response.status_code == 200
+            }
+        except requests.RequestException as e:
+            return {
+                'status_code': 0,
+                'final_url': link,
+                'accessible': False,
+                'error': str(e)
+            }
     
     def validate_wikipedia_links(self, links: List[str], timeout: int = 10) -> Dict[str, Dict]:
         """Validate Wikipedia links and return status information"""
         results = {}
+        # Repeated links share one request
+        unique_links = list(dict.fromkeys(links))
+        if not unique_links:
+            return results
         
-        for link in links:
-            try:
-                if link.startswith('/wiki/'):
-                    full_url = f"https://en.wikipedia.org{link}"
-                else:
-                    full_url = link
-                
-                response = self.session.head(full_url, timeout=timeout)
-                results[link] = {
-                    'status_code': response.status_code,
-                    'final_url': response.url,
-                    'accessible': response.status_code == 200
-                }
-            except requests.RequestException as e:
-                results[link] = {
-                    'status_code': 0,
-                    'final_url': link,
-                    'accessible': False,
-                    'error': str(e)
-                }
+        # Requests are latency-bound, so issue them concurrently over the pooled session
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unique_links))) as executor:
+            for link, result in zip(unique_links, executor.map(lambda link: self._head(link, timeout), unique_links)):
+                results[link] = result
         
         return results
     
@@ -8,6 +8,7 @@ from pathlib import Path
 import json
 from test.text_links.test_config import CURRENT_ENCYCLOPEDIA_FILE, OUTPUT_DIR, MAX_REDIRECT_DEPTH
 from test.text_links.link_extractor import EncyclopediaLinkExtractor, LinkValidator
+from test.text_links.test_utilities import save_test_results
 
 class TestSearchUrlResolution:
     """Test search URL resolution to canonical article URLs"""
@@ -26,29 +27,23 @@ class TestSearchUrlResolution:
     
     def test_extract_search_urls(self):
         """Extract all search URLs from encyclopedia"""
-        # Define inputs
-        html_content = self.input_file.read_text(encoding='utf-8')
-        
         # Call module
-        entries = self.extractor.extract_entries(html_content)
+        entries = self.extractor.extract_entries_from_path(self.input_file)
         search_urls = [entry['search_url'] for entry in entries if entry['search_url']]
         
         # Make assertions
         assert len(search_urls) > 0, "No search URLs found"
-        assert all(url.startswith('https://en.wikipedia.org/w/index.php?search=') for url in search_urls), \
-            "Search URLs don't match expected pattern"
+        search_prefix = 'https://en.wikipedia.org/w/index.php?search='
+        bad_url = next((url for url in search_urls if not url.startswith(search_prefix)), None)
+        assert bad_url is None, f"Search URL doesn't match expected pattern: {bad_url}"
         
         # Save results
-        with open(self.resolution_results_file, 'w') as f:
-            json.dump(search_urls, f, indent=2)
+        save_test_results(search_urls, self.resolution_results_file)
     
     def test_resolve_search_urls(self):
         """Resolve search URLs to canonical article URLs"""
-        # Define inputs
-        html_content = self.input_file.read_text(encoding='utf-8')
-        
         # Call module
-        entries = self.extractor.extract_entries(html_content)
+        entries = self.extractor.extract_entries_from_path(self.input_file)
         resolutions = {}
         
         for entry in entries[:3]:  # Test first 3 entries
@@ -65,12 +60,12 @@ class TestSearchUrlResolution:
         assert len(resolutions) > 0, "No resolutions found"
         assert all(res['status_code'] == 200 for res in resolutions.values()), \
             "Some search URLs failed to resolve"
-        assert all('wiki/' in res['canonical_url'] for res in resolutions.values()), \
-            "Resolved URLs should be Wikipedia article URLs"
+        bad_url = next((res['canonical_url'] for res in resolutions.values()
+                        if 'wiki/' not in res['canonical_url']), None)
+        assert bad_url is None, f"Resolved URLs should be Wikipedia article URLs: {bad_url}"
         
         # Save results
-        with open(self.resolution_results_file, 'w') as f:
-            json.dump(resolutions, f, indent=2)
+        save_test_results(resolutions, self.resolution_results_file)
     
     def test_validate_resolved_urls(self):
         """Validate that resolved URLs are accessible"""
@@ -95,8 +90,7 @@ class TestSearchUrlResolution:
         assert accessible_count > 0, "No accessible URLs found"
         
         # Save results
-        with open(self.validation_report_file, 'w') as f:
-            json.dump(validation_results, f, indent=2)
+        save_test_results(validation_results, self.validation_report_file)
     
     def test_redirect_depth_limits(self):
         """Test that redirects don't exceed maximum depth"""
@@ -119,11 +113,8 @@ class TestSearchUrlResolution:
     
     def test_section_anchor_preservation(self):
         """Test that section anchors are preserved in resolved URLs"""
-        # Define inputs
-        html_content = self.input_file.read_text(encoding='utf-8')
-        
         # Call module
-        entries = self.extractor.extract_entries(html_content)
+        entries = self.extractor.extract_entries_from_path(self.input_file)
         section_urls = []
         
         for entry in entries[:2]:  # Test first 2 entries
@@ -9,6 +9,7 @@ import json
 from urllib.parse import urljoin
 from test.text_links.test_config import CURRENT_ENCYCLOPEDIA_FILE, OUTPUT_DIR, MIN_LINKS_PER_ENTRY
 from test.text_links.link_extractor import EncyclopediaLinkExtractor, LinkValidator
+from test.text_links.test_utilities import save_test_results
 
 class TestDescriptionLinkTargets:
     """Test extraction and validation of description links"""
@@ -28,11 +29,8 @@ class TestDescriptionLinkTargets:
     
     def test_extract_description_links(self):
         """Extract all links from description paragraphs"""
-        # Define inputs
-        html_content = self.input_file.read_text(encoding='utf-8')
-        
         # Call module
-        entries = self.extractor.extract_entries(html_content)
+        entries = self.extractor.extract_entries_from_path(self.input_file)
         all_description_links = []
         
         for entry in entries:
@@ -58,8 +56,43 @@ class TestDescriptionLinkTargets:
         assert len(citation_links) == 0, f"Found {len(citation_links)} citation links (should be 0)"
         
         # Save results
-        with open(self.description_links_file, 'w') as f:
-            json.dump(all_description_links, f, indent=2)
+        save_test_results(all_description_links, self.description_links_file)
+    
+    def test_repeated_extraction_returns_independent_copies(self):
+        """Re-extracting the same HTML reuses the parse but hands out fresh entries"""
+        # Call module
+        entries = self.extractor.extract_entries_from_path(self.input_file)
+        entries[0]['term'] = 'changed'
+        entries[0]['description_links'].clear()
+        repeated = EncyclopediaLinkExtractor().extract_entries_from_path(self.input_file)
+        
+        # Make assertions
+        assert repeated[0]['term'] != 'changed'
+        assert repeated[0]['description_links'], "Cached entry was mutated by a caller"
+        assert len(repeated) == len(entries)
+    
+    def test_repeated_extraction_shares_parse_across_extractors(self, monkeypatch):
+        """A fresh extractor reuses the entries parsed from an unchanged file"""
+        # Call module
+        entries = self.extractor.extract_entries_from_path(self.input_file)
+        monkeypatch.setattr(EncyclopediaLinkExtractor, '_parse_entries',
+                            lambda extractor, html_content: pytest.fail("File was parsed again"))
+        repeated = EncyclopediaLinkExtractor().extract_entries_from_path(self.input_file)
+        
+        # Make assertions
+        assert repeated == entries
+    
+    def test_extract_entries_from_empty_file(self, tmp_path):
+        """An empty HTML file has no entries"""
+        # Define inputs
+        empty_file = tmp_path / "empty.html"
+        empty_file.write_bytes(b"")
+        
+        # Call module
+        entries = self.extractor.extract_entries_from_path(empty_file)
+        
+        # Make assertions
+        assert entries == []
     
     def test_classify_link_types(self):
         """Classify links by type (article, file, help, external)"""
@@ -109,8 +142,7 @@ class TestDescriptionLinkTargets:
                     "Help links incorrectly classified"
         
         # Save results
-        with open(self.link_classification_file, 'w') as f:
-            json.dump(link_classification, f, indent=2)
+        save_test_results(link_classification, self.link_classification_file)
     
     def test_validate_internal_links(self):
         """Validate internal Wikipedia links are accessible"""
@@ -183,15 +215,24 @@ class TestDescriptionLinkTargets:
             'meaningful_text': []
         }
         
+        # Track raw text lengths of meaningful links in the same pass
+        min_text_len = None
+        max_text_len = 0
         for entry in all_links:
             for link in entry['links']:
-                text = link['text'].strip()
+                raw_text = link['text']
+                text = raw_text.strip()
                 if not text:
                     link_text_analysis['empty_text'].append(link)
                 elif text.isspace():
                     link_text_analysis['whitespace_only'].append(link)
                 else:
                     link_text_analysis['meaningful_text'].append(link)
+                    text_len = len(raw_text)
+                    if min_text_len is None or text_len < min_text_len:
+                        min_text_len = text_len
+                    if text_len > max_text_len:
+                        max_text_len = text_len
         
         # Make assertions
         assert len(link_text_analysis['meaningful_text']) > 0, "No meaningful link text found"
@@ -200,6 +241,5 @@ class TestDescriptionLinkTargets:
         assert len(link_text_analysis['whitespace_only']) == 0, f"Found {len(link_text_analysis['whitespace_only'])} links with whitespace-only text"
         
         # Verify text length is reasonable
-        meaningful_links = link_text_analysis['meaningful_text']
-        assert all(len(link['text']) > 0 for link in meaningful_links), "Some meaningful links have zero-length text"
-        assert all(len(link['text']) < 100 for link in meaningful_links), "Some links have unusually long text"
+        assert min_text_len > 0, "Some meaningful links have zero-length text"
+        assert max_text_len < 100, "Some links have unusually long text"
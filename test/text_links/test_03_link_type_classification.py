@@ -7,6 +7,7 @@ import pytest
 from pathlib import Path
 import json
 import re
+from urllib.parse import urlparse
 from test.text_links.test_config import CURRENT_ENCYCLOPEDIA_FILE, OUTPUT_DIR
 from test.text_links.link_extractor import EncyclopediaLinkExtractor
 
@@ -25,13 +26,10 @@ class TestLinkTypeClassification:
         self.link_patterns_file = Path(self.output_dir, "link_patterns_analysis.json")
         self.target_summary_file = Path(self.output_dir, "target_summary.json")
     
-    def test_classify_all_link_types(self):
+    def test_classify_all_link_types(self, encyclopedia_entries):
         """Classify all links by target type"""
-        # Define inputs
-        html_content = self.input_file.read_text(encoding='utf-8')
-        
         # Call module
-        entries = self.extractor.extract_entries(html_content)
+        entries = encyclopedia_entries
         all_link_targets = self.extractor.extract_all_link_targets(entries)
         
         # Make assertions
@@ -154,8 +152,7 @@ class TestLinkTypeClassification:
         
         for link in external_links:
             if link.startswith('http'):
-                parsed = self.extractor.session.get(link, timeout=1).url if link.startswith('http') else link
-                domain = parsed.split('/')[2] if '/' in parsed else parsed
+                domain = urlparse(link).netloc
                 patterns['domains'].append(domain)
                 
                 if link.startswith('https://'):
@@ -25,13 +25,10 @@ class TestExternalLinkTargets:
         self.domain_analysis_file = Path(self.output_dir, "domain_analysis.json")
         self.protocol_analysis_file = Path(self.output_dir, "protocol_analysis.json")
     
-    def test_extract_external_links(self):
+    def test_extract_external_links(self, encyclopedia_entries):
         """Extract all external (non-Wikipedia) links"""
-        # Define inputs
-        html_content = self.input_file.read_text(encoding='utf-8')
-        
         # Call module
-        entries = self.extractor.extract_entries(html_content)
+        entries = encyclopedia_entries
         external_links = []
         
         for entry in entries:
@@ -7,6 +7,9 @@ import pytest
 from pathlib import Path
 import json
 import requests
+import threading
+import time
+from types import SimpleNamespace
 from test.text_links.test_config import CURRENT_ENCYCLOPEDIA_FILE, OUTPUT_DIR, MAX_REDIRECT_DEPTH
 from test.text_links.link_extractor import EncyclopediaLinkExtractor, LinkValidator
 
@@ -301,3 +304,37 @@ class TestArticleAccessibility:
         # Save results
         with open(self.error_report_file, 'w') as f:
             json.dump(error_report, f, indent=2)
+    
+    def test_validate_links_concurrently(self, monkeypatch):
+        """Validate links over the pooled session in parallel, keeping input order"""
+        # Define inputs
+        links = [f"/wiki/Article_{i}" for i in range(8)] + ["https://example.org/missing"]
+        active = []
+        peak = []
+        requested = []
+        lock = threading.Lock()
+        
+        def fake_head(url, timeout):
+            with lock:
+                requested.append(url)
+                active.append(url)
+                peak.append(len(active))
+            time.sleep(0.05)
+            with lock:
+                active.remove(url)
+            if url.endswith('missing'):
+                raise requests.exceptions.ConnectionError("unreachable")
+            return SimpleNamespace(status_code=200, url=url)
+        
+        monkeypatch.setattr(self.validator.session, 'head', fake_head)
+        
+        # Call module
+        validation_results = self.validator.validate_wikipedia_links(links + links[:3])
+        
+        # Make assertions
+        assert list(validation_results) == links
+        assert len(requested) == len(links), "Repeated links should be requested once"
+        assert validation_results["/wiki/Article_0"]['final_url'] == "https://en.wikipedia.org/wiki/Article_0"
+        assert validation_results["/wiki/Article_7"]['accessible'] is True
+        assert validation_results["https://example.org/missing"]['status_code'] == 0
+        assert max(peak) > 1
@@ -0,0 +1,113 @@
+"""
+Test 12: Build network graphs from shared links
+Purpose: Check the bipartite graphs built from shared_article_links JSON
+"""
+
+import pytest
+from pathlib import Path
+import json
+from test.text_links.create_network_graph import (
+    create_bipartite_graph_from_json,
+    create_filtered_graph,
+    export_to_multiple_formats,
+    export_to_pickle,
+    load_graph_pickle,
+)
+
+SHARED_LINKS = {
+    'shared_article_links': {
+        'https://en.wikipedia.org/wiki/Greenhouse_gas': {
+            'article_name': 'Greenhouse gas',
+            'occurrence_count': 12,
+            'entries': [
+                {'term': 'methane', 'link_text': 'greenhouse gas', 'title': 'Greenhouse gas'},
+                {'term': 'carbon dioxide', 'link_text': 'greenhouse gases', 'title': 'Greenhouse gas'},
+                {'term': 'methane', 'link_text': 'GHG', 'title': 'Greenhouse gas'},
+            ],
+        },
+        'https://en.wikipedia.org/wiki/Methane': {
+            'article_name': 'methane',
+            'occurrence_count': 3,
+            'entries': [
+                {'term': 'Greenhouse gas'},
+            ],
+        },
+    }
+}
+
+
+class TestNetworkGraph:
+    """Test creation of bipartite network graphs"""
+
+    def setup_method(self):
+        """Setup test parameters"""
+        self.data = json.loads(json.dumps(SHARED_LINKS))
+
+    def test_bipartite_graph_from_json(self, tmp_path):
+        """Build the full bipartite graph and check nodes, weights and attributes"""
+        # Define inputs
+        json_file = Path(tmp_path, "shared_article_links_3.json")
+        json_file.write_text(json.dumps(self.data), encoding='utf-8')
+
+        # Call module
+        B, entries, targets = create_bipartite_graph_from_json(json_file)
+
+        # Make assertions
+        assert entries == {'methane', 'carbon dioxide', 'Greenhouse gas'}
+        assert targets == {'Greenhouse gas', 'methane'}
+        assert list(B.nodes) == ['Greenhouse gas', 'methane', 'carbon dioxide']
+        assert B.nodes['Greenhouse gas']['node_type'] == 'target'
+        assert B.nodes['Greenhouse gas']['occurrence_count'] == 12
+        assert B.nodes['carbon dioxide'] == {'bipartite': 0, 'node_type': 'entry'}
+        # Repeated links and the reverse link share one undirected edge
+        assert B.number_of_edges() == 2
+        assert B['methane']['Greenhouse gas']['weight'] == 3
+        assert B['methane']['Greenhouse gas']['link_text'] == 'greenhouse gas'
+        assert B['carbon dioxide']['Greenhouse gas']['weight'] == 1
+
+    def test_export_selected_formats(self, tmp_path):
+        """Export only the requested formats"""
+        # Define inputs
+        json_file = Path(tmp_path, "shared_article_links_3.json")
+        B, _, _ = create_bipartite_graph_from_json(json_file, data=self.data)
+
+        # Call module
+        gexf_file, graphml_file, csv_file, adjlist_file, stats_file = export_to_multiple_formats(
+            B, json_file, formats={'gexf', 'stats'})
+
+        # Make assertions
+        assert gexf_file.exists()
+        assert graphml_file is None and csv_file is None and adjlist_file is None
+        stats = json.loads(stats_file.read_text(encoding='utf-8'))
+        assert stats['total_nodes'] == 3
+        assert stats['total_edges'] == 2
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "shared_article_links_3.gexf", "shared_article_links_3_network_stats.json"]
+        with pytest.raises(ValueError):
+            export_to_multiple_formats(B, json_file, formats={'svg'})
+
+    def test_pickle_round_trip(self, tmp_path):
+        """Save the graph as a gzipped pickle and load it back unchanged"""
+        # Define inputs
+        json_file = Path(tmp_path, "shared_article_links_3.json")
+        B, _, _ = create_bipartite_graph_from_json(json_file, data=self.data)
+
+        # Call module
+        pickle_file = export_to_pickle(B, json_file)
+        loaded = load_graph_pickle(pickle_file)
+
+        # Make assertions
+        assert pickle_file.name == "shared_article_links_3.pkl.gz"
+        assert list(loaded.nodes(data=True)) == list(B.nodes(data=True))
+        assert list(loaded.edges(data=True)) == list(B.edges(data=True))
+
+    def test_filtered_graph(self):
+        """Keep only articles shared at least min_occurrences times"""
+        # Call module
+        B, entries, targets = create_filtered_graph(None, min_occurrences=10, data=self.data)
+
+        # Make assertions
+        assert targets == {'Greenhouse gas'}
+        assert entries == {'methane', 'carbon dioxide'}
+        assert B['methane']['Greenhouse gas'] == {'weight': 2}
+        assert B.nodes['Greenhouse gas']['occurrence_count'] == 12
@@ -10,6 +10,11 @@ from pathlib import Path
 from typing import Dict, List, Any
 from test.text_links.test_config import OUTPUT_DIR
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class TextLinksTestRunner:
     """Test runner for text links analysis"""
     
@@ -236,8 +241,12 @@ def create_test_output_dir(test_name: str) -> Path:
     test_dir.mkdir(parents=True, exist_ok=True)
     return test_dir
 
-def save_test_results(data: Dict[str, Any], file_path: Path):
-    """Save test results to JSON file"""
+def save_test_results(data: Any, file_path: Path):
+    """Save test results to JSON file, using orjson when it is installed"""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
     with open(file_path, 'w') as f:
         json.dump(data, f, indent=2)
 
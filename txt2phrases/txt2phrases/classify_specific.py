@@ -33,8 +33,9 @@ def classify_keywords_split_files(input_dir, output_dir, threshold=0.6, min_freq
         if not {"keyword", "count"}.issubset(df.columns):
             raise ValueError(f"{file} must contain 'keyword' and 'count' columns")
         df = df[df["count"] >= min_freq]
-        for _, row in df.iterrows():
-            keyword_chapter_freq[str(row["keyword"])][chapter] = int(row["count"])
+        # Convert whole columns at once rather than building a Series per row
+        for keyword, count in zip(df["keyword"].map(str), df["count"].astype(int).tolist()):
+            keyword_chapter_freq[keyword][chapter] = count
 
     chapters = sorted(chapters)
     keywords = list(keyword_chapter_freq.keys())
@@ -7,7 +7,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
 from txt2phrases.pdf2txt import convert_pdf_to_text
-from txt2phrases.html2txt import convert_html_to_text
+from txt2phrases.html2txt import convert_html_to_text, convert_all_html
 from txt2phrases.keyword import KeywordExtraction
 from txt2phrases.pygetpaper import main as pygetpaper_main
 
@@ -31,12 +31,14 @@ def main():
     parser_html = subparsers.add_parser("html2txt", help="Convert HTML(s) to TXT")
     parser_html.add_argument("-i", "--input", required=True, help="Input HTML file or folder")
     parser_html.add_argument("-o", "--output", required=True, help="Output folder")
+    parser_html.add_argument("-w", "--workers", type=int, default=4, help="Worker processes for folder input")
 
     # Keyword Extraction
     parser_keyword = subparsers.add_parser("keyphrases", help="Extract keywords from TXT files")
     parser_keyword.add_argument("-i", "--input", required=True, help="Input TXT file or folder")
     parser_keyword.add_argument("-o", "--output", required=True, help="Output folder")
     parser_keyword.add_argument("-n", "--top_n", type=int, default=1000, help="Top N keywords")
+    parser_keyword.add_argument("-c", "--cache", default=None, help="Folder to cache full keyword rankings")
 
     # Auto pipeline
     parser_auto = subparsers.add_parser("auto", help="Run full pipeline: PDF → TXT → keywords")
@@ -83,8 +85,7 @@ def main():
             html_files = list(input_path.glob("*.html"))
             print(f"Found {len(html_files)} HTML files to convert")
             
-            for html_file in html_files:
-                convert_html_to_text(html_file, output_path)
+            convert_all_html(html_files, output_path, workers=args.workers)
             
             print(f"All HTML files converted to TXT in: {output_path}")
         else:
@@ -94,7 +95,8 @@ def main():
         extractor = KeywordExtraction(
             input_path=args.input,
             output_folder=args.output,
-            top_n=args.top_n
+            top_n=args.top_n,
+            cache_folder=args.cache
         )
         extractor.extract()
         
@@ -1,8 +1,17 @@
 import os
 import argparse
+import multiprocessing
 from bs4 import BeautifulSoup
 from tqdm import tqdm
 
+# lxml's C parser is several times faster than the pure-Python html.parser;
+# use it when installed
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
 def convert_html_to_text(html_path, output_folder):
     """
     Convert a single HTML file to plain text and save it.
@@ -11,7 +20,7 @@ def convert_html_to_text(html_path, output_folder):
         with open(html_path, "r", encoding="utf-8") as f:
             html_content = f.read()
 
-        soup = BeautifulSoup(html_content, "html.parser")
+        soup = BeautifulSoup(html_content, HTML_PARSER)
         text = soup.get_text(separator="\n", strip=True)
 
         base_name = os.path.splitext(os.path.basename(html_path))[0]
@@ -26,6 +35,47 @@ def convert_html_to_text(html_path, output_folder):
         return None
 
 
+def convert_single_html(args):
+    """
+    Convert one (html_path, output_folder) pair in a worker process.
+
+    Returns the HTML path with the TXT path (or None), since
+    imap_unordered yields results out of order.
+    """
+    html_path, output_folder = args
+    return html_path, convert_html_to_text(html_path, output_folder)
+
+
+def convert_all_html(html_paths, output_folder, workers=4):
+    """
+    Convert many HTML files to TXT in parallel worker processes.
+    """
+    if not html_paths:
+        return []
+
+    args = [(html_path, output_folder) for html_path in html_paths]
+    # Hand out several files per task so small files don't pay IPC per file
+    chunksize = max(1, len(args) // (workers * 4))
+
+    results = {}
+    try:
+        with multiprocessing.Pool(processes=workers) as pool:
+            for html_path, txt_path in tqdm(
+                pool.imap_unordered(convert_single_html, args, chunksize=chunksize),
+                total=len(args),
+                desc="Converting HTML files",
+            ):
+                results[html_path] = txt_path
+    except Exception as e:
+        print(f"Multiprocessing failed ({e}), switching to sequential mode.")
+        # Only convert the files the pool did not finish
+        remaining = [html_path for html_path in html_paths if html_path not in results]
+        for html_path in tqdm(remaining, desc="Converting HTML files (sequential)"):
+            results[html_path] = convert_html_to_text(html_path, output_folder)
+
+    return [results[html_path] for html_path in html_paths if results.get(html_path)]
+
+
 def main(args=None):
     parser = argparse.ArgumentParser(description="Convert HTML files to TXT automatically")
     parser.add_argument(
@@ -36,6 +86,10 @@ def main(args=None):
         "-o", "--output", required=True,
         help="Folder to save converted TXT files"
     )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=4,
+        help="Number of worker processes for folder conversion"
+    )
 
     args = parser.parse_args()
 
@@ -55,9 +109,8 @@ def main(args=None):
         html_files = [f for f in os.listdir(input_path) if f.lower().endswith(".html")]
         print(f"Found {len(html_files)} HTML files to convert.\n")
 
-        for html_file in tqdm(html_files, desc="Converting HTML files"):
-            html_path = os.path.join(input_path, html_file)
-            convert_html_to_text(html_path, output_folder)
+        html_paths = [os.path.join(input_path, html_file) for html_file in html_files]
+        convert_all_html(html_paths, output_folder, workers=args.workers)
 
         print(f"\nAll HTML files converted to TXT in: {output_folder}")
 
@@ -1,5 +1,7 @@
+import hashlib
 import os
 import re
+import tempfile
 from collections import Counter
 import pandas as pd
 from tqdm import tqdm
@@ -43,14 +45,26 @@ class KeywordExtraction:
     Extracts keywords from a TXT file or folder of TXT files.
     """
 
-    def __init__(self, input_path, output_folder, top_n=1000):
+    def __init__(self, input_path, output_folder, top_n=1000, cache_folder=None):
         self.input_path = input_path
         self.output_folder = output_folder
         self.top_n = top_n
+        self.cache_folder = cache_folder
         os.makedirs(self.output_folder, exist_ok=True)
+        if self.cache_folder:
+            os.makedirs(self.cache_folder, exist_ok=True)
 
         self.model_name = "ml6team/keyphrase-extraction-kbir-inspec"
-        self.extractor = KeyphraseExtractionPipeline(model_name=self.model_name)
+        self._extractor = None
+
+    @property
+    def extractor(self):
+        """
+        Load the model on first use, so fully cached runs never load it.
+        """
+        if self._extractor is None:
+            self._extractor = KeyphraseExtractionPipeline(model_name=self.model_name)
+        return self._extractor
 
     def _read_text(self, file_path, method="sentence"):
         """
@@ -70,9 +84,19 @@ class KeywordExtraction:
 
         return text
 
-    def _process_single_file(self, file_path):
+    def _cache_path(self, file_path):
         """
-        Extract keywords from a single TXT file.
+        Cache file for a TXT file's full keyword ranking, keyed by its content and the model.
+        """
+        digest = hashlib.blake2b(self.model_name.encode("utf-8"), digest_size=16)
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return os.path.join(self.cache_folder, f"{digest.hexdigest()}.csv")
+
+    def _rank_keyphrases(self, file_path):
+        """
+        Run the model over a TXT file and rank every keyphrase by count.
         """
         text_chunks = self._read_text(file_path, method="sentence")
         keyphrases = []
@@ -83,10 +107,34 @@ class KeywordExtraction:
             for phrases in batch_phrases_list:
                 keyphrases.extend(phrases)
 
-        counts = Counter(keyphrases)
-        top_keywords = counts.most_common(self.top_n)
+        return Counter(keyphrases).most_common()
+
+    def _process_single_file(self, file_path):
+        """
+        Extract keywords from a single TXT file.
+
+        With a cache folder the full ranking is stored once per file content,
+        so re-running with a different top_n only re-reads the first rows.
+        """
+        cache_path = self._cache_path(file_path) if self.cache_folder else None
+
+        if cache_path and os.path.exists(cache_path):
+            df = pd.read_csv(cache_path, nrows=self.top_n, keep_default_na=False)
+        else:
+            ranked = self._rank_keyphrases(file_path)
+            if cache_path:
+                # Write beside the cache file and swap it in, so a concurrent or
+                # interrupted run never leaves a partial ranking behind
+                fd, tmp_path = tempfile.mkstemp(dir=self.cache_folder, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+                        pd.DataFrame(ranked, columns=["keyword", "count"]).to_csv(f, index=False)
+                    os.replace(tmp_path, cache_path)
+                except BaseException:
+                    os.remove(tmp_path)
+                    raise
+            df = pd.DataFrame(ranked[:self.top_n], columns=["keyword", "count"])
 
-        df = pd.DataFrame(top_keywords, columns=["keyword", "count"])
         base_name = os.path.splitext(os.path.basename(file_path))[0]
         output_csv = os.path.join(self.output_folder, f"{base_name}_keywords.csv")
         df.to_csv(output_csv, index=False)
@@ -124,13 +172,15 @@ def main(args=None):
     parser.add_argument("-i", "--input", required=True, help="Path to TXT file or folder containing TXT files")
     parser.add_argument("-o", "--output", required=True, help="Folder to save keyword CSVs")
     parser.add_argument("-n", "--top_n", type=int, default=1000, help="Number of top keywords to extract")
+    parser.add_argument("-c", "--cache", default=None, help="Folder to cache full keyword rankings between runs")
 
     args = parser.parse_args()
 
     extractor = KeywordExtraction(
         input_path=args.input,
         output_folder=args.output,
-        top_n=args.top_n
+        top_n=args.top_n,
+        cache_folder=args.cache
     )
     extractor.extract()
 